@@ -1 +1 @@
-from .db_manager import DBManager
+from .db_manager import DBManager, Section
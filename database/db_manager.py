@@ -1,14 +1,115 @@
 # paper_agent/database/db_manager.py
 
 import sqlite3
+import itertools
 import os
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import numpy as np
 
 from utils.config import config
 from utils.logger import logger
 
+# Per-connection tuning. journal_mode=WAL is persistent in the database file and
+# only needs to be set once per path; the rest must be set on every connection.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",  # Required for the schema's ON DELETE CASCADE to apply
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA busy_timeout=5000",
+)
+_wal_enabled_paths = set()
+
+_EMBEDDING_STORAGE_DTYPES = ("float32", "float16", "int8")
+
+# Lightweight row type for sections; cheaper to build than a dict per row.
+Section = namedtuple("Section", "id paper_id section_title content page_number embedding")
+
+# SQLite caches compiled statements per connection keyed by SQL text, so hot
+# statements are kept as module constants to guarantee identical text.
+_STATEMENT_CACHE_SIZE = 256
+_PAPER_BY_FILEPATH_CACHE_SIZE = 1024
+
+# Writes
+# added_date is computed by SQLite (local time) rather than bound from Python; the
+# explicit expression also works for databases created before the column default.
+_SQL_INSERT_PAPER = (
+    "INSERT INTO papers (title, authors, publication_year, abstract, file_path, added_date, doi, url) "
+    "VALUES (?, ?, ?, ?, ?, datetime('now', 'localtime'), ?, ?)"
+)
+_SQL_UPDATE_SUMMARY = "UPDATE papers SET summary_text = ?, is_summarized = 1 WHERE id = ?"
+_SQL_DELETE_PAPER = "DELETE FROM papers WHERE id = ?"
+_SQL_UPSERT_TAG = "INSERT INTO tags (name) VALUES (?) ON CONFLICT(name) DO UPDATE SET name = excluded.name RETURNING id"
+_SQL_INSERT_PAPER_TAG = "INSERT OR IGNORE INTO paper_tags (paper_id, tag_id) VALUES (?, ?)"
+_SQL_INSERT_TAG = "INSERT OR IGNORE INTO tags (name) VALUES (?)"
+_SQL_INSERT_PAPER_TAG_BY_NAME = "INSERT OR IGNORE INTO paper_tags (paper_id, tag_id) SELECT ?, id FROM tags WHERE name = ?"
+_SQL_DELETE_PAPER_TAG = "DELETE FROM paper_tags WHERE paper_id = ? AND tag_id = ?"
+_SQL_INSERT_SECTION = (
+    "INSERT INTO sections (paper_id, section_title, content, page_number, embedding) VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_UPSERT_PAPER_EMBEDDINGS = (
+    "INSERT OR REPLACE INTO paper_embeddings (paper_id, dim, count, dtype, scales, data) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_REFERENCE = (
+    "INSERT INTO paper_references "
+    "(citing_paper_id, cited_title, cited_authors, cited_year, cited_doi, cited_url, is_in_library) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_CACHED_EMBEDDING = "INSERT OR IGNORE INTO embedding_cache (content_hash, embedding) VALUES (?, ?)"
+_SQL_UPDATE_REFERENCE_IN_LIBRARY = "UPDATE paper_references SET is_in_library = ? WHERE id = ?"
+
+# Hot reads
+_SQL_SELECT_PAPER = "SELECT * FROM papers WHERE id = ?"
+_SQL_SELECT_PAPER_BY_FILEPATH = "SELECT * FROM papers WHERE file_path = ?"
+_SQL_SELECT_SECTIONS_FOR_PAPER = (
+    "SELECT id, paper_id, section_title, content, page_number, embedding FROM sections "
+    "WHERE paper_id = ? ORDER BY page_number ASC, id ASC"
+)
+_SQL_SELECT_PAPER_EMBEDDINGS = "SELECT dim, count, dtype, scales, data FROM paper_embeddings WHERE paper_id = ?"
+
+
+def _embedding_blob(embedding: np.ndarray) -> memoryview:
+    """
+    Returns a zero-copy BLOB view of an embedding as contiguous float32.
+    sqlite3 binds any buffer, so no intermediate bytes object is built.
+    """
+    return memoryview(np.ascontiguousarray(embedding, dtype=np.float32))
+
+
+def _encode_embedding_matrix(matrix: np.ndarray, dtype: str) -> Tuple[memoryview, Optional[memoryview]]:
+    """
+    Encodes a float32 (count, dim) matrix for storage as BLOB views over the encoded arrays.
+    int8 uses a symmetric per-row scale (max(|row|) / 127); returns (data, scales).
+    """
+    if dtype == "float16":
+        return memoryview(matrix.astype(np.float16)), None
+    if dtype == "int8":
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0  # All-zero rows quantize to zeros
+        quantized = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+        return memoryview(quantized), _embedding_blob(scales)
+    return _embedding_blob(matrix), None
+
+
+def _decode_embedding_matrix(
+    data: bytes, scales: Optional[bytes], dtype: str, count: int, dim: int
+) -> np.ndarray:
+    """
+    Decodes a stored embedding matrix back to a float32 (count, dim) array.
+    """
+    if dtype == "float16":
+        return np.frombuffer(data, dtype=np.float16).reshape(count, dim).astype(np.float32)
+    if dtype == "int8":
+        matrix = np.frombuffer(data, dtype=np.int8).reshape(count, dim).astype(np.float32)
+        matrix *= np.frombuffer(scales, dtype=np.float32)[:, None]  # In place: no second (count, dim) temporary
+        return matrix
+    return np.frombuffer(data, dtype=np.float32).reshape(count, dim)
+
+
 
 class DBManager:
     """
@@ -20,6 +121,19 @@ class DBManager:
         db_dir = config.get("DB_DIR")
         db_name = config.get("DATABASE_NAME")
         self.db_path = os.path.join(db_dir, db_name)
+        self._local = threading.local()  # One long-lived connection per thread
+        # LRU of file_path -> paper row; cleared whenever a papers row changes
+        self._paper_by_filepath_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._paper_cache_lock = threading.Lock()
+        # Bumped by every write that may change section embeddings; next() on a count is atomic across threads
+        self._embeddings_generations = itertools.count(1)
+        self._embeddings_generation = 0
+        self.embedding_storage_dtype = config.get("EMBEDDING_STORAGE_DTYPE", "int8")
+        if self.embedding_storage_dtype not in _EMBEDDING_STORAGE_DTYPES:
+            logger.warning(
+                f"Unknown EMBEDDING_STORAGE_DTYPE '{self.embedding_storage_dtype}'. Falling back to float32."
+            )
+            self.embedding_storage_dtype = "float32"
         self._initialize_db()
         logger.info(f"Database initialized at: {self.db_path}")
 
@@ -30,77 +144,144 @@ class DBManager:
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
             schema_path = os.path.join(os.path.dirname(__file__), "schema.sql")
             with open(schema_path, "r") as f:
                 schema_sql = f.read()
-            cursor.executescript(schema_sql)
-            conn.commit()
+            conn.executescript(schema_sql)
         except sqlite3.Error as e:
             logger.error(f"Error initializing database: {e}")
             raise
-        finally:
-            self.close_connection(conn)
 
     def get_connection(self) -> sqlite3.Connection:
         """
-        Establishes and returns a database connection.
+        Returns the calling thread's database connection, opening it on first use.
+        The connection runs in autocommit mode; writes manage their own transactions.
         """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
             conn.row_factory = sqlite3.Row  # Allows accessing columns by name
+            if self.db_path not in _wal_enabled_paths:
+                conn.execute("PRAGMA journal_mode=WAL")
+                _wal_enabled_paths.add(self.db_path)
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            # Analyzes tables whose statistics are missing or stale, with a bounded cost; PRAGMA
+            # optimize without 0x10000 only covers tables this connection has already queried
+            conn.execute("PRAGMA optimize=0x10002")
+            self._local.conn = conn
             return conn
         except sqlite3.Error as e:
             logger.error(f"Error connecting to database: {e}")
             raise
 
-    def close_connection(self, conn: sqlite3.Connection):
+    def close_connection(self):
         """
-        Closes a database connection.
+        Closes the calling thread's database connection, if one is open, after letting
+        SQLite refresh the planner statistics of the tables it queried.
         """
-        if conn:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self.optimize()
             conn.close()
+            self._local.conn = None
+
+    def optimize(self):
+        """
+        Runs PRAGMA optimize so SQLite can refresh query planner statistics. It only considers
+        tables queried on the calling thread's connection, so call it from a long-lived one.
+        """
+        try:
+            self.get_connection().execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
 
     def _execute_query(self, query: str, params: tuple = ()) -> Optional[List[sqlite3.Row]]:
         """
         Helper method to execute a read query and return results.
         Returns None on error.
         """
-        conn = None
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            cursor = self.get_connection().cursor()
             cursor.execute(query, params)
             return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Database query failed: {query} with params {params}. Error: {e}")
             return None
-        finally:
-            self.close_connection(conn)
 
-    def _execute_update(self, query: str, params: tuple = ()) -> Optional[int]:
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
         """
-        Helper method to execute an insert/update/delete query.
-        Returns the last row ID for inserts or number of affected rows for updates/deletes.
-        Returns None on error.
+        Runs a block of writes as one transaction (BEGIN IMMEDIATE ... COMMIT) and
+        yields a cursor for it. Rolls back and re-raises if the block or the COMMIT fails,
+        so the thread's connection is never left inside an open transaction.
         """
-        conn = None
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            if query.strip().upper().startswith("INSERT"):
-                return cursor.lastrowid
-            return cursor.rowcount
+            yield cursor
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:  # SQLite may already have rolled back, e.g. after a full disk
+                conn.execute("ROLLBACK")
+            raise
+
+    def _execute_write(self, query: str, params: tuple = ()) -> Optional[sqlite3.Cursor]:
+        """
+        Helper method to execute an insert/update/delete query in its own transaction.
+        Returns the cursor it ran on, or None on error.
+        """
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(query, params)
+            return cursor
         except sqlite3.IntegrityError as e:
             logger.warning(f"Database integrity error: {e}. Query: {query} with params {params}")
             return None  # Indicate failure due to integrity constraint
         except sqlite3.Error as e:
             logger.error(f"Database update failed: {query} with params {params}. Error: {e}")
             return None
-        finally:
-            self.close_connection(conn)
+
+    def _execute_insert(self, query: str, params: tuple = ()) -> Optional[int]:
+        """
+        Helper method to execute an insert query.
+        Returns the last row ID, or None on error.
+        """
+        cursor = self._execute_write(query, params)
+        return cursor.lastrowid if cursor is not None else None
+
+    def _execute_modify(self, query: str, params: tuple = ()) -> Optional[int]:
+        """
+        Helper method to execute an update/delete query (or an insert whose row ID is not needed).
+        Returns the number of affected rows, or None on error.
+        """
+        cursor = self._execute_write(query, params)
+        return cursor.rowcount if cursor is not None else None
+
+    def _execute_many(self, query: str, params_seq: List[tuple]) -> Optional[int]:
+        """
+        Helper method to execute an insert/update/delete query for many parameter
+        tuples inside a single transaction.
+        Returns the number of affected rows, or None on error (nothing is written).
+        """
+        try:
+            with self.transaction() as cursor:
+                cursor.executemany(query, params_seq)
+            return cursor.rowcount
+        except sqlite3.IntegrityError as e:
+            logger.warning(f"Database integrity error: {e}. Query: {query} with {len(params_seq)} rows")
+            return None
+        except sqlite3.Error as e:
+            logger.error(f"Database batch update failed: {query} with {len(params_seq)} rows. Error: {e}")
+            return None
 
     # --- Paper Operations ---
 
@@ -118,24 +299,57 @@ class DBManager:
         Adds a new paper to the database.
         Returns the ID of the newly added paper, or None if failed.
         """
-        added_date = datetime.now().isoformat(sep=" ", timespec="seconds")
-        query = """
-        INSERT INTO papers (title, authors, publication_year, abstract, file_path, added_date, doi, url)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        params = (title, authors, publication_year, abstract, file_path, added_date, doi, url)
-        paper_id = self._execute_update(query, params)
+        params = (title, authors, publication_year, abstract, file_path, doi, url)
+        paper_id = self._execute_insert(_SQL_INSERT_PAPER, params)
         if paper_id:
             logger.info(f"Added paper: '{title}' (ID: {paper_id})")
         return paper_id
 
+    def add_paper_with_sections(
+        self,
+        title: str,
+        file_path: str,
+        sections: List[Dict[str, Any]],
+        embeddings: Optional[np.ndarray] = None,
+        authors: Optional[str] = None,
+        publication_year: Optional[int] = None,
+        abstract: Optional[str] = None,
+        doi: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Adds a paper, its sections and (optionally) its packed embedding matrix
+        in one transaction, so an ingest is either stored completely or not at all.
+        Each section is a dict with 'section_title', 'content' and 'page_number'.
+        Returns the ID of the newly added paper, or None if failed.
+        """
+        paper_params = (title, authors, publication_year, abstract, file_path, doi, url)
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(_SQL_INSERT_PAPER, paper_params)
+                paper_id = cursor.lastrowid
+                cursor.executemany(
+                    _SQL_INSERT_SECTION,
+                    [(paper_id, sec["section_title"], sec["content"], sec["page_number"], None) for sec in sections],
+                )
+                if embeddings is not None:
+                    cursor.execute(_SQL_UPSERT_PAPER_EMBEDDINGS, self._paper_embeddings_params(paper_id, embeddings))
+        except sqlite3.IntegrityError as e:
+            logger.warning(f"Database integrity error while adding paper '{title}': {e}")
+            return None
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Failed to add paper '{title}' with {len(sections)} sections: {e}")
+            return None
+        self._embeddings_changed()
+        logger.info(f"Added paper: '{title}' (ID: {paper_id}) with {len(sections)} sections")
+        return paper_id
+
     def get_paper(self, paper_id: int) -> Optional[Dict[str, Any]]:
         """
         Retrieves a paper by its ID.
         Returns a dictionary representing the paper, or None if not found.
         """
-        query = "SELECT * FROM papers WHERE id = ?"
-        result = self._execute_query(query, (paper_id,))
+        result = self._execute_query(_SQL_SELECT_PAPER, (paper_id,))
         return dict(result[0]) if result else None
 
     def get_paper_by_filepath(self, file_path: str) -> Optional[Dict[str, Any]]:
@@ -143,9 +357,48 @@ class DBManager:
         Retrieves a paper by its file path.
         Returns a dictionary representing the paper, or None if not found.
         """
-        query = "SELECT * FROM papers WHERE file_path = ?"
-        result = self._execute_query(query, (file_path,))
-        return dict(result[0]) if result else None
+        with self._paper_cache_lock:
+            cached = self._paper_by_filepath_cache.get(file_path)
+            if cached is not None:
+                self._paper_by_filepath_cache.move_to_end(file_path)
+                return dict(cached)
+
+        result = self._execute_query(_SQL_SELECT_PAPER_BY_FILEPATH, (file_path,))
+        if not result:
+            return None  # Misses are not cached, so new papers need no invalidation
+        paper = dict(result[0])
+        with self._paper_cache_lock:
+            self._paper_by_filepath_cache[file_path] = paper
+            if len(self._paper_by_filepath_cache) > _PAPER_BY_FILEPATH_CACHE_SIZE:
+                self._paper_by_filepath_cache.popitem(last=False)
+        return dict(paper)
+
+    def _invalidate_paper_cache(self):
+        """
+        Drops cached paper rows after a papers row is updated or deleted.
+        """
+        with self._paper_cache_lock:
+            self._paper_by_filepath_cache.clear()
+
+    def _embeddings_changed(self):
+        """
+        Marks section embeddings as changed, so embeddings_version() returns a new value.
+        """
+        self._embeddings_generation = next(self._embeddings_generations)
+
+    def embeddings_version(self) -> Optional[Tuple[int, int]]:
+        """
+        Returns a value that changes whenever section embeddings may have changed, so callers
+        can cache get_embedding_matrix() results: a counter of this manager's own writes plus
+        SQLite's data_version, which changes when another connection commits.
+        Returns None if it cannot be determined.
+        """
+        try:
+            data_version = self.get_connection().execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read the database's data_version: {e}")
+            return None
+        return self._embeddings_generation, data_version
 
     def get_all_papers(self) -> List[Dict[str, Any]]:
         """
@@ -155,13 +408,36 @@ class DBManager:
         results = self._execute_query(query)
         return [dict(row) for row in results] if results else []
 
+    def list_papers_brief(self) -> List[Dict[str, Any]]:
+        """
+        Retrieves the columns needed to list papers, skipping large TEXT
+        fields such as abstract and summary_text.
+        """
+        query = (
+            "SELECT id, title, authors, publication_year, file_path, added_date, is_summarized "
+            "FROM papers ORDER BY added_date DESC"
+        )
+        results = self._execute_query(query)
+        return [dict(row) for row in results] if results else []
+
+    def get_paper_titles(self, paper_ids: List[int]) -> Dict[int, str]:
+        """
+        Retrieves the titles of several papers in one query.
+        Returns {paper_id: title}; IDs that do not exist are left out.
+        """
+        if not paper_ids:
+            return {}
+        placeholders = ", ".join("?" * len(paper_ids))
+        results = self._execute_query(f"SELECT id, title FROM papers WHERE id IN ({placeholders})", tuple(paper_ids))
+        return {row[0]: row[1] for row in results} if results else {}
+
     def update_paper_summary(self, paper_id: int, summary_text: str) -> bool:
         """
         Updates the summary text and sets is_summarized to true for a paper.
         Returns True on success, False otherwise.
         """
-        query = "UPDATE papers SET summary_text = ?, is_summarized = 1 WHERE id = ?"
-        rows_affected = self._execute_update(query, (summary_text, paper_id))
+        rows_affected = self._execute_modify(_SQL_UPDATE_SUMMARY, (summary_text, paper_id))
+        self._invalidate_paper_cache()
         if rows_affected == 1:
             logger.info(f"Updated summary for paper ID: {paper_id}")
             return True
@@ -170,12 +446,13 @@ class DBManager:
 
     def delete_paper(self, paper_id: int) -> bool:
         """
-        Deletes a paper and all its associated data (tags, sections, paper_references)
-        due to CASCADE DELETE constraints.
+        Deletes a paper and all its associated data (tags, sections, embeddings,
+        paper_references) in one statement via ON DELETE CASCADE (foreign_keys is on).
         Returns True on success, False otherwise.
         """
-        query = "DELETE FROM papers WHERE id = ?"
-        rows_affected = self._execute_update(query, (paper_id,))
+        rows_affected = self._execute_modify(_SQL_DELETE_PAPER, (paper_id,))
+        self._invalidate_paper_cache()
+        self._embeddings_changed()
         if rows_affected == 1:
             logger.info(f"Deleted paper with ID: {paper_id}")
             return True
@@ -189,15 +466,14 @@ class DBManager:
         Adds a new tag if it doesn't exist.
         Returns the ID of the tag, or None if failed.
         """
-        # Check if tag already exists
-        existing_tag = self.get_tag_by_name(name)
-        if existing_tag:
-            return existing_tag["id"]
-
-        query = "INSERT INTO tags (name) VALUES (?)"
-        tag_id = self._execute_update(query, (name,))
-        if tag_id:
-            logger.info(f"Added tag: '{name}' (ID: {tag_id})")
+        # Single upsert: returns the id of the new or the existing tag
+        try:
+            with self.transaction() as cursor:
+                tag_id = cursor.execute(_SQL_UPSERT_TAG, (name,)).fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"Database update failed: {_SQL_UPSERT_TAG} with params {(name,)}. Error: {e}")
+            return None
+        logger.debug(f"Resolved tag: '{name}' (ID: {tag_id})")
         return tag_id
 
     def get_tag_by_name(self, name: str) -> Optional[Dict[str, Any]]:
@@ -221,14 +497,29 @@ class DBManager:
         Associates a tag with a paper.
         Returns True on success, False if already exists or failed.
         """
-        query = "INSERT OR IGNORE INTO paper_tags (paper_id, tag_id) VALUES (?, ?)"
-        rows_affected = self._execute_update(query, (paper_id, tag_id))
+        rows_affected = self._execute_modify(_SQL_INSERT_PAPER_TAG, (paper_id, tag_id))
         if rows_affected is not None:  # It can be 0 if already exists, which is not an error
             if rows_affected == 1:
                 logger.info(f"Associated paper {paper_id} with tag {tag_id}")
             return True
         return False
 
+    def add_paper_tags(self, paper_id: int, tag_names: List[str]) -> bool:
+        """
+        Associates several tags with a paper in one transaction, creating tags that don't exist.
+        Returns True on success (including tags already associated), False if failed.
+        """
+        try:
+            with self.transaction() as cursor:
+                cursor.executemany(_SQL_INSERT_TAG, [(name,) for name in tag_names])
+                cursor.executemany(_SQL_INSERT_PAPER_TAG_BY_NAME, [(paper_id, name) for name in tag_names])
+                rows_added = cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Failed to add tags {tag_names} to paper {paper_id}. Error: {e}")
+            return False
+        logger.info(f"Associated paper {paper_id} with {rows_added} new tags")
+        return True
+
     def get_tags_for_paper(self, paper_id: int) -> List[Dict[str, Any]]:
         """
         Retrieves all tags associated with a specific paper.
@@ -248,8 +539,7 @@ class DBManager:
         Removes a tag association from a paper.
         Returns True on success, False otherwise.
         """
-        query = "DELETE FROM paper_tags WHERE paper_id = ? AND tag_id = ?"
-        rows_affected = self._execute_update(query, (paper_id, tag_id))
+        rows_affected = self._execute_modify(_SQL_DELETE_PAPER_TAG, (paper_id, tag_id))
         if rows_affected == 1:
             logger.info(f"Removed tag {tag_id} from paper {paper_id}")
             return True
@@ -270,57 +560,255 @@ class DBManager:
         Adds a parsed section of a paper.
         Embedding is stored as BLOB.
         """
-        embedding_blob = embedding.tobytes() if embedding is not None else None
-        query = "INSERT INTO sections (paper_id, section_title, content, page_number, embedding) VALUES (?, ?, ?, ?, ?)"
+        embedding_blob = _embedding_blob(embedding) if embedding is not None else None
         params = (paper_id, section_title, content, page_number, embedding_blob)
-        section_id = self._execute_update(query, params)
+        section_id = self._execute_insert(_SQL_INSERT_SECTION, params)
         if section_id:
+            self._embeddings_changed()
             logger.debug(f"Added section for paper {paper_id}: '{section_title}' (ID: {section_id})")
         return section_id
 
-    def get_sections_for_paper(self, paper_id: int) -> List[Dict[str, Any]]:
-        """
-        Retrieves all sections for a given paper.
-        Converts embedding BLOB back to numpy array.
-        """
-        query = "SELECT id, paper_id, section_title, content, page_number, embedding FROM sections WHERE paper_id = ? ORDER BY page_number ASC"
-        results = self._execute_query(query, (paper_id,))
-        sections = []
-        if results:
-            for row in results:
-                section_data = dict(row)
-                if section_data["embedding"]:
-                    section_data["embedding"] = np.frombuffer(
-                        section_data["embedding"], dtype=np.float32
-                    )  # Assuming float32
-                sections.append(section_data)
-        return sections
-
-    def get_section_by_id(self, section_id: int) -> Optional[Dict[str, Any]]:
+    def add_sections(self, rows: List[tuple]) -> Optional[int]:
+        """
+        Adds many sections in a single transaction.
+        Each row is (paper_id, section_title, content, page_number, embedding),
+        where embedding is a numpy array or None.
+        Returns the number of sections added, or None if failed.
+        """
+        params_seq = [
+            (paper_id, section_title, content, page_number, _embedding_blob(embedding) if embedding is not None else None)
+            for paper_id, section_title, content, page_number, embedding in rows
+        ]
+        rows_added = self._execute_many(_SQL_INSERT_SECTION, params_seq)
+        if rows_added:
+            self._embeddings_changed()
+            logger.debug(f"Added {rows_added} sections in one batch.")
+        return rows_added
+
+    def get_sections_for_paper(self, paper_id: int) -> List[Section]:
+        """
+        Retrieves all sections for a given paper as Section tuples.
+        Embeddings come from the paper's packed matrix when present, otherwise
+        from each section's own BLOB.
+        """
+        results = self._execute_query(_SQL_SELECT_SECTIONS_FOR_PAPER, (paper_id,))
+        if not results:
+            return []
+
+        matrix = self.get_paper_embeddings(paper_id)
+        if matrix is not None and matrix.shape[0] == len(results):
+            # Matrix rows follow section id order; results are ordered by page
+            matrix_row = {section_id: i for i, section_id in enumerate(sorted(row[0] for row in results))}
+            return [Section(*row[:5], matrix[matrix_row[row[0]]]) for row in results]
+        return [
+            Section(*row[:5], np.frombuffer(row[5], dtype=np.float32) if row[5] else None)  # Assuming float32
+            for row in results
+        ]
+
+    def get_section_by_id(self, section_id: int) -> Optional[Section]:
         """
         Retrieves a single section by its ID.
         Converts embedding BLOB back to numpy array.
         """
         query = "SELECT id, paper_id, section_title, content, page_number, embedding FROM sections WHERE id = ?"
         result = self._execute_query(query, (section_id,))
-        if result:
-            section_data = dict(result[0])
-            if section_data["embedding"]:
-                section_data["embedding"] = np.frombuffer(section_data["embedding"], dtype=np.float32)
-            return section_data
-        return None
+        if not result:
+            return None
+        row = result[0]
+        if row["embedding"]:
+            return Section(*row[:5], np.frombuffer(row["embedding"], dtype=np.float32))
+
+        embedding = None
+        matrix = self.get_paper_embeddings(row["paper_id"])
+        if matrix is not None:
+            position = self._execute_query(
+                "SELECT COUNT(*) FROM sections WHERE paper_id = ? AND id < ?",
+                (row["paper_id"], section_id),
+            )
+            row_idx = position[0][0] if position else None
+            if row_idx is not None and row_idx < matrix.shape[0]:
+                embedding = matrix[row_idx]
+        return Section(*row[:5], embedding)
+
+    def get_sections_by_ids(self, section_ids: List[int]) -> List[Section]:
+        """
+        Retrieves sections by ID, in the order given, without their embeddings.
+        IDs that do not exist are skipped.
+        """
+        if not section_ids:
+            return []
+        placeholders = ", ".join("?" * len(section_ids))
+        query = f"SELECT id, paper_id, section_title, content, page_number FROM sections WHERE id IN ({placeholders})"
+        results = self._execute_query(query, tuple(section_ids))
+        by_id = {row[0]: Section(*row, None) for row in results} if results else {}
+        return [by_id[section_id] for section_id in section_ids if section_id in by_id]
+
+    def get_embedding_matrix(
+        self, paper_ids: Optional[List[int]] = None, dim: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Loads the embeddings of all sections (or only those of paper_ids) as one
+        contiguous float32 (N, D) matrix for vectorized scoring.
+        Returns (section_ids, matrix); row i of matrix belongs to section_ids[i].
+        Sections without embeddings are left out, as are papers embedded with a different
+        dimension than `dim` (by default, that of the most recently added paper).
+        """
+        paper_filter, params = "", ()
+        if paper_ids is not None:
+            if not paper_ids:
+                return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)
+            paper_filter = f" WHERE paper_id IN ({', '.join('?' * len(paper_ids))})"
+            params = tuple(paper_ids)
+
+        # A paper's sections are inserted in one transaction, so their ids are normally consecutive and
+        # each paper's ids can be rebuilt from one (first, last, count) row instead of one row per section
+        id_ranges = self._execute_query(
+            f"SELECT paper_id, MIN(id), MAX(id), COUNT(*) FROM sections{paper_filter} GROUP BY paper_id", params
+        )
+        section_ids_by_paper: Dict[int, np.ndarray] = {}
+        for paper_id, first_id, last_id, count in id_ranges or []:
+            if last_id - first_id + 1 == count:
+                section_ids_by_paper[paper_id] = np.arange(first_id, last_id + 1, dtype=np.int64)
+            else:
+                rows = self._execute_query("SELECT id FROM sections WHERE paper_id = ? ORDER BY id", (paper_id,))
+                section_ids_by_paper[paper_id] = np.array([row[0] for row in rows or []], dtype=np.int64)
+
+        blocks: List[Tuple[int, np.ndarray, np.ndarray]] = []
+        packed = self._execute_query(
+            f"SELECT paper_id, dim, count, dtype, scales, data FROM paper_embeddings{paper_filter}", params
+        )
+        for row in packed or []:
+            ids = section_ids_by_paper.pop(row["paper_id"], np.empty(0, dtype=np.int64))
+            if len(ids) != row["count"]:
+                logger.warning(f"Embedding matrix of paper {row['paper_id']} does not match its sections. Skipping.")
+                continue
+            blocks.append(
+                (
+                    row["paper_id"],
+                    ids,
+                    _decode_embedding_matrix(row["data"], row["scales"], row["dtype"], row["count"], row["dim"]),
+                )
+            )
+
+        # Papers without a packed matrix fall back to per-section BLOBs
+        for paper_id in section_ids_by_paper:
+            rows = self._execute_query(
+                "SELECT id, embedding FROM sections WHERE paper_id = ? AND embedding IS NOT NULL ORDER BY id", (paper_id,)
+            )
+            if rows:
+                blocks.append(
+                    (
+                        paper_id,
+                        np.array([row[0] for row in rows], dtype=np.int64),
+                        np.stack([np.frombuffer(row[1], dtype=np.float32) for row in rows]),
+                    )
+                )
+
+        if not blocks:
+            return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)
+        if dim is None:
+            dim = max(blocks, key=lambda item: item[0])[2].shape[1]
+        skipped = sorted(paper_id for paper_id, _, block in blocks if block.shape[1] != dim)
+        if skipped:
+            logger.warning(
+                f"Skipping embeddings of papers {skipped}: their dimension differs from {dim}. "
+                "Re-add them to embed them with the current model."
+            )
+            blocks = [item for item in blocks if item[2].shape[1] == dim]
+            if not blocks:
+                return np.empty(0, dtype=np.int64), np.empty((0, dim), dtype=np.float32)
+        section_ids = np.concatenate([ids for _, ids, _ in blocks])
+        matrix = np.empty((section_ids.shape[0], dim), dtype=np.float32)
+        offset = 0
+        for _, _, block in blocks:
+            matrix[offset : offset + block.shape[0]] = block
+            offset += block.shape[0]
+        return section_ids, matrix
 
     def delete_sections_for_paper(self, paper_id: int) -> bool:
         """
-        Deletes all sections associated with a specific paper.
+        Deletes all sections associated with a specific paper, along with its packed embeddings,
+        in one transaction. Not needed before delete_paper, which cascades.
         Returns True on success, False otherwise.
         """
-        query = "DELETE FROM sections WHERE paper_id = ?"
-        rows_affected = self._execute_update(query, (paper_id,))
-        if rows_affected is not None:
-            logger.info(f"Deleted {rows_affected} sections for paper ID: {paper_id}")
-            return True
-        return False
+        try:
+            with self.transaction() as cursor:
+                cursor.execute("DELETE FROM paper_embeddings WHERE paper_id = ?", (paper_id,))
+                rows_affected = cursor.execute("DELETE FROM sections WHERE paper_id = ?", (paper_id,)).rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Failed to delete sections for paper ID: {paper_id}. Error: {e}")
+            return False
+        self._embeddings_changed()
+        logger.info(f"Deleted {rows_affected} sections for paper ID: {paper_id}")
+        return True
+
+    # --- Embedding Matrix Operations ---
+
+    def set_paper_embeddings(self, paper_id: int, matrix: np.ndarray) -> bool:
+        """
+        Stores all section embeddings of a paper as one packed (count, dim) BLOB,
+        encoded as EMBEDDING_STORAGE_DTYPE (float32, float16 or int8).
+        Row i must belong to the paper's i-th section in id order.
+        Returns True on success, False otherwise.
+        """
+        try:
+            params = self._paper_embeddings_params(paper_id, matrix)
+        except ValueError as e:
+            logger.error(str(e))
+            return False
+        if self._execute_modify(_SQL_UPSERT_PAPER_EMBEDDINGS, params) is None:
+            return False
+        self._embeddings_changed()
+        logger.debug(f"Stored {params[2]}x{params[1]} {params[3]} embedding matrix for paper {paper_id}")
+        return True
+
+    def _paper_embeddings_params(self, paper_id: int, matrix: np.ndarray) -> tuple:
+        """
+        Builds the _SQL_UPSERT_PAPER_EMBEDDINGS parameters for a (count, dim) matrix.
+        Raises ValueError if the matrix is not 2-D.
+        """
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError(f"Expected a 2-D embedding matrix for paper {paper_id}, got shape {matrix.shape}.")
+        dtype = self.embedding_storage_dtype
+        data, scales = _encode_embedding_matrix(matrix, dtype)
+        return (paper_id, matrix.shape[1], matrix.shape[0], dtype, scales, data)
+
+    def get_paper_embeddings(self, paper_id: int) -> Optional[np.ndarray]:
+        """
+        Retrieves the packed embedding matrix of a paper as a (count, dim) float32 array.
+        Returns None if the paper has no packed embeddings.
+        """
+        result = self._execute_query(_SQL_SELECT_PAPER_EMBEDDINGS, (paper_id,))
+        if not result:
+            return None
+        row = result[0]
+        return _decode_embedding_matrix(row["data"], row["scales"], row["dtype"], row["count"], row["dim"])
+
+    # --- Embedding Cache Operations ---
+
+    def get_cached_embeddings(self, content_hashes: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Looks up cached embeddings by content hash.
+        Returns a dict of hash -> float32 vector for the hashes that are cached.
+        """
+        if not content_hashes:
+            return {}
+        placeholders = ", ".join("?" * len(content_hashes))
+        query = f"SELECT content_hash, embedding FROM embedding_cache WHERE content_hash IN ({placeholders})"
+        results = self._execute_query(query, tuple(content_hashes))
+        return {row[0]: np.frombuffer(row[1], dtype=np.float32) for row in results} if results else {}
+
+    def add_cached_embeddings(self, entries: List[Tuple[bytes, np.ndarray]]) -> Optional[int]:
+        """
+        Caches (content_hash, embedding) pairs in one transaction; hashes already cached are left as is.
+        Returns the number of new entries, or None if failed.
+        """
+        params_seq = [(content_hash, _embedding_blob(embedding)) for content_hash, embedding in entries]
+        rows_added = self._execute_many(_SQL_INSERT_CACHED_EMBEDDING, params_seq)
+        if rows_added:
+            logger.debug(f"Cached {rows_added} new embeddings.")
+        return rows_added
 
     # --- Paper Reference Operations ---
 
@@ -338,12 +826,8 @@ class DBManager:
         Adds a reference cited by a paper.
         Returns the ID of the newly added reference, or None if failed.
         """
-        query = """
-        INSERT INTO paper_references (citing_paper_id, cited_title, cited_authors, cited_year, cited_doi, cited_url, is_in_library)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """
         params = (citing_paper_id, cited_title, cited_authors, cited_year, cited_doi, cited_url, 1 if is_in_library else 0)
-        ref_id = self._execute_update(query, params)
+        ref_id = self._execute_insert(_SQL_INSERT_REFERENCE, params)
         if ref_id:
             logger.debug(f"Added reference for paper {citing_paper_id}: '{cited_title}' (ID: {ref_id})")
         return ref_id
@@ -361,8 +845,7 @@ class DBManager:
         Updates the 'is_in_library' status for a specific reference.
         Returns True on success, False otherwise.
         """
-        query = "UPDATE paper_references SET is_in_library = ? WHERE id = ?"
-        rows_affected = self._execute_update(query, (1 if is_in_library else 0, ref_id))
+        rows_affected = self._execute_modify(_SQL_UPDATE_REFERENCE_IN_LIBRARY, (1 if is_in_library else 0, ref_id))
         if rows_affected == 1:
             logger.info(f"Updated is_in_library status for paper reference ID: {ref_id} to {is_in_library}")
             return True
@@ -8,7 +8,7 @@ CREATE TABLE IF NOT EXISTS papers (
     publication_year INTEGER,
     abstract TEXT,
     file_path TEXT NOT NULL UNIQUE, -- Absolute path to the PDF
-    added_date TEXT NOT NULL, -- ISO format date (YYYY-MM-DD HH:MM:SS)
+    added_date TEXT NOT NULL DEFAULT (datetime('now', 'localtime')), -- ISO format date (YYYY-MM-DD HH:MM:SS)
     is_summarized INTEGER DEFAULT 0, -- 0 for false, 1 for true
     summary_text TEXT,
     doi TEXT UNIQUE,
@@ -41,6 +41,25 @@ CREATE TABLE IF NOT EXISTS sections (
     FOREIGN KEY (paper_id) REFERENCES papers(id) ON DELETE CASCADE
 );
 
+-- Table to store all section embeddings of a paper as one packed matrix.
+-- Row i of the matrix belongs to the paper's i-th section in id order.
+CREATE TABLE IF NOT EXISTS paper_embeddings (
+    paper_id INTEGER PRIMARY KEY,
+    dim INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    dtype TEXT NOT NULL DEFAULT 'float32', -- 'float32', 'float16' or 'int8'
+    scales BLOB, -- int8 only: one float32 scale per row
+    data BLOB NOT NULL, -- count x dim values of dtype, row-major
+    FOREIGN KEY (paper_id) REFERENCES papers(id) ON DELETE CASCADE
+);
+
+-- Cache of section embeddings keyed by a hash of the embedding model name and section text,
+-- so re-ingesting unchanged text skips the model. Not tied to any paper.
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    content_hash BLOB PRIMARY KEY, -- blake2b digest of model name + text
+    embedding BLOB NOT NULL -- float32 vector
+) WITHOUT ROWID;
+
 -- Table to store references cited within a paper
 CREATE TABLE IF NOT EXISTS paper_references (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -53,3 +72,9 @@ CREATE TABLE IF NOT EXISTS paper_references (
     is_in_library INTEGER DEFAULT 0, -- 0 if not in our papers table, 1 if it is
     FOREIGN KEY (citing_paper_id) REFERENCES papers(id) ON DELETE CASCADE
 );
+
+-- Indexes for the per-paper lookups. paper_tags(paper_id) and tags(name) are
+-- already covered by the composite primary key and the UNIQUE constraint.
+CREATE INDEX IF NOT EXISTS idx_sections_paper_page ON sections(paper_id, page_number);
+CREATE INDEX IF NOT EXISTS idx_paper_tags_tag ON paper_tags(tag_id);
+CREATE INDEX IF NOT EXISTS idx_paper_references_citing ON paper_references(citing_paper_id);
@@ -1,37 +1,76 @@
 # paper_agent/llm/llm_interface.py
 
-from openai import Client
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from utils.logger import logger
 from utils.config import config
 import json
 
+if TYPE_CHECKING:
+    from openai import Client
+
 
 class LLMInterface:
     """
     A placeholder class to interact with Large Language Models (LLMs).
     In a real implementation, this would connect to OpenAI, Anthropic,
     HuggingFace, or a local LLM via their respective APIs.
+    The client (and openai itself) is created on first use, so startup does not wait for it.
     """
 
     def __init__(self):
         self.api_key = config.get("LLM_API_KEY")
         self.base_url = config.get("BASE_URL")
         self.model_name = config.get("LLM_MODEL_NAME")
+        # Provider-specific request fields; strict OpenAI-compatible servers reject unknown ones
+        self.disable_thinking = config.get("LLM_DISABLE_THINKING", True)
+        self.send_prompt_cache_key = config.get("LLM_PROMPT_CACHE_KEY", False)
+        self._client: Optional["Client"] = None
+        self._client_lock = threading.Lock()
         if self.api_key == "YOUR_OPENAI_API_KEY_OR_OTHER_LLM_KEY":
             logger.warning("LLM_API_KEY is not set in config.json. LLM calls will be simulated.")
             self.simulate_mode = True
         else:
             self.simulate_mode = False
-            # In a real scenario, initialize the LLM client here
-            # e.g., self.client = OpenAI(api_key=self.api_key)
-            self.client = Client(api_key=self.api_key, base_url=self.base_url)
             logger.info(f"LLMInterface initialized with model: {self.model_name}")
 
-    def generate_text(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7) -> Optional[str]:
+    @property
+    def client(self) -> "Client":
+        """
+        The OpenAI client, created on first access. Importing openai takes about half a second,
+        so this is left to the first LLM call (or the background warmup) rather than startup.
+        """
+        if self._client is None:
+            with self._client_lock:  # warmup thread and first call may race here
+                if self._client is None:
+                    from openai import Client
+
+                    self._client = Client(api_key=self.api_key, base_url=self.base_url)
+        return self._client
+
+    def warmup(self):
+        """
+        Opens the client's pooled keep-alive connection with a cheap request (listing models),
+        so the first real LLM call does not pay for the TCP/TLS handshake.
+        Failures are only logged; the connection is then opened by the first real call.
+        """
+        if self.simulate_mode:
+            return
+        try:
+            self.client.models.list()
+            logger.debug("LLM client connection warmed up.")
+        except Exception as e:
+            logger.debug(f"LLM client warmup failed (will connect on first call): {e}")
+
+    def generate_text(
+        self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7, cache_key: Optional[str] = None
+    ) -> Optional[str]:
         """
         Generates text using the configured LLM.
         For now, it simulates a response if API key is not set.
+        If LLM_PROMPT_CACHE_KEY is enabled, `cache_key` is sent as the provider's prompt cache
+        key, so requests that share a prompt prefix are routed to where that prefix is cached.
         """
         if self.simulate_mode:
             logger.info(f"Simulating LLM response for prompt (first 100 chars): {prompt[:100]}...")
@@ -52,6 +91,11 @@ class LLMInterface:
         else:
             # --- REAL LLM API CALL WOULD GO HERE ---
             # Example for OpenAI:
+            extra_body = {}
+            if self.disable_thinking:
+                extra_body["enable_thinking"] = False
+            if self.send_prompt_cache_key and cache_key:
+                extra_body["prompt_cache_key"] = cache_key
             try:
                 response = self.client.chat.completions.create(
                     model=self.model_name,
@@ -62,7 +106,7 @@ class LLMInterface:
                     max_tokens=max_tokens,
                     temperature=temperature,
                     response_format={"type": "json_object"} if "json" in prompt.lower() else {"type": "text"},
-                    extra_body={"enable_thinking": False},
+                    extra_body=extra_body or None,
                 )
                 return response.choices[0].message.content
             except Exception as e:
@@ -74,13 +118,42 @@ class LLMInterface:
             # self.simulate_mode = True
             # return self.generate_text(prompt, max_tokens, temperature)  # Fallback to simulation
 
+    def generate_text_batch(
+        self,
+        prompts: List[str],
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        concurrency: Optional[int] = None,
+        cache_key: Optional[str] = None,
+    ) -> List[Optional[str]]:
+        """
+        Generates text for several independent prompts, keeping up to `concurrency`
+        (default: config LLM_MAX_CONCURRENCY, 8) requests in flight at once.
+        Results are returned in prompt order; a failed prompt yields None.
+        """
+        concurrency = concurrency or config.get("LLM_MAX_CONCURRENCY", 8)
+        if len(prompts) <= 1 or concurrency <= 1 or self.simulate_mode:
+            return [self.generate_text(prompt, max_tokens, temperature, cache_key) for prompt in prompts]
+
+        # Requests are I/O bound, so threads sharing the client's connection pool suffice
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(prompts))) as executor:
+            return list(
+                executor.map(lambda prompt: self.generate_text(prompt, max_tokens, temperature, cache_key), prompts)
+            )
+
     def generate_json(
-        self, prompt: str, schema: Optional[Dict] = None, max_tokens: int = 1000, temperature: float = 0.7
+        self,
+        prompt: str,
+        schema: Optional[Dict] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        cache_key: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Generates a JSON response from the LLM based on the prompt and an optional schema.
+        `cache_key` is passed on to generate_text.
         """
-        raw_response = self.generate_text(prompt, max_tokens, temperature)
+        raw_response = self.generate_text(prompt, max_tokens, temperature, cache_key=cache_key)
         if raw_response:
             try:
                 # Attempt to parse as JSON. LLM might return non-JSON if not prompted correctly.
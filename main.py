@@ -2,17 +2,10 @@
 
 import os
 import sys
+import threading
 
 from utils.config import config
 from utils.logger import logger
-from database.db_manager import DBManager
-from parsers.pdf_parser import PDFParser
-from llm.llm_interface import LLMInterface
-from embeddings.embedding_model import EmbeddingModel
-from rag.retriever import Retriever
-from rag.generator import Generator
-from management.paper_manager import PaperManager
-from ui.cli import CLI  # Import CLI
 
 
 def main():
@@ -34,7 +27,19 @@ def main():
 
     # --- Initialize Core Components ---
     try:
+        # Imported here rather than at module level so importing main stays cheap
+        from database.db_manager import DBManager
+        from parsers.pdf_parser import PDFParser
+        from llm.llm_interface import LLMInterface
+        from embeddings.embedding_model import EmbeddingModel
+        from rag.retriever import Retriever
+        from rag.generator import Generator
+        from management.paper_manager import PaperManager
+        from ui.cli import CLI
+
         llm_interface = LLMInterface()
+        # Open the LLM connection in the background while the rest of the app starts
+        threading.Thread(target=llm_interface.warmup, name="llm-warmup", daemon=True).start()
         embedding_model = EmbeddingModel()
         db_manager = DBManager()
         pdf_parser = PDFParser(llm_interface)
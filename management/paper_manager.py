@@ -1,18 +1,76 @@
 # paper_agent/management/paper_manager.py
 
+import hashlib
 import os
+import queue
+import re
+import threading
+from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+import numpy as np
 
 from database.db_manager import DBManager
-from parsers.pdf_parser import PDFParser
+from parsers.pdf_parser import PDFParser, extract_pdf
+from parsers.parse_cache import ParseCache
 from embeddings.embedding_model import EmbeddingModel
 from rag.retriever import Retriever
-from rag.generator import Generator
+from rag.generator import Generator, GENERATION_ERROR_ANSWER
+from rag.answer_cache import AnswerCache
 from llm.llm_interface import LLMInterface  # Needed for summary generation
 from utils.logger import logger
 from utils.config import config  # For chunking parameters
 
+# Sections are handed from the parsing thread to the embedding model one model batch
+# (EMBEDDING_BATCH_SIZE) at a time; at most this many batches wait in between,
+# bounding memory if embedding falls behind.
+_EMBED_QUEUE_SIZE = 4
+
+# Summary prompt templates. Everything before the first placeholder is identical for every
+# paper, so providers can serve it from their prompt cache; its hash keys that cache.
+_SUMMARY_TEMPLATE = (
+    "Please provide a comprehensive and concise summary of the following academic paper.\n"
+    "Focus on the main objectives, methodology, key findings, and conclusions.\n"
+    "Ensure the summary is easy to understand for a non-expert, yet captures the essence of the research.\n"
+    "\n"
+    "Paper Content:\n"
+    "---\n"
+    "{context}\n"
+    "---\n"
+    "\n"
+    "Comprehensive Summary:\n"
+)
+# Template for the per-window ("map") summaries of papers too long for one summary prompt.
+_PARTIAL_SUMMARY_TEMPLATE = (
+    "Please summarize the following excerpt of an academic paper.\n"
+    "Keep any objectives, methodology, key findings, and conclusions it contains; omit everything else.\n"
+    "\n"
+    "Excerpt (part {part} of {total}):\n"
+    "---\n"
+    "{excerpt}\n"
+    "---\n"
+    "\n"
+    "Summary of this part:\n"
+)
+
+
+def _prompt_cache_key(name: str, template: str) -> str:
+    static_prefix = template.partition("{")[0]
+    return f"{name}-{hashlib.sha256(static_prefix.encode()).hexdigest()[:16]}"
+
+
+_SUMMARY_CACHE_KEY = _prompt_cache_key("summary", _SUMMARY_TEMPLATE)
+_PARTIAL_SUMMARY_CACHE_KEY = _prompt_cache_key("partial-summary", _PARTIAL_SUMMARY_TEMPLATE)
+
+# Year of a PDF date string such as "D:20230101120000Z" (the "D:" prefix is optional in practice).
+_CREATION_YEAR_RE = re.compile(r"(?:D:)?(\d{4})")
+
+# Default cap on worker processes for multi-PDF ingestion; beyond this, parallel reads of
+# many files tend to contend for disk I/O rather than speed things up.
+_MAX_INGEST_WORKERS = 8
+
 
 class PaperManager:
     """
@@ -38,16 +96,27 @@ class PaperManager:
 
         self.chunk_size = config.get("PDF_CHUNK_SIZE", 1000)
         self.chunk_overlap = config.get("PDF_CHUNK_OVERLAP", 200)
+        self.parse_cache = ParseCache()
+        self.answer_cache = AnswerCache()
 
         logger.info("PaperManager initialized.")
 
-    def add_paper_from_file(self, file_path: str) -> Optional[int]:
+    def add_paper_from_file(
+        self,
+        file_path: str,
+        pages: Optional[List[Tuple[int, str]]] = None,
+        pdf_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[int]:
         """
         Adds a new paper to the system by parsing its PDF, extracting metadata,
         chunking its content, generating embeddings, and storing everything in the database.
+        The PDF is opened once; every extraction step shares that reader.
 
         Args:
             file_path (str): The absolute path to the PDF file.
+            pages (Optional[List[Tuple[int, str]]]): Already extracted (page_number, text) pairs;
+                                                     if None, pages are read from file_path.
+            pdf_metadata (Optional[Dict[str, Any]]): Already extracted pypdf metadata to go with `pages`.
 
         Returns:
             Optional[int]: The ID of the newly added paper, or None if the operation failed.
@@ -64,79 +133,261 @@ class PaperManager:
 
         logger.info(f"Adding new paper from: {file_path}")
 
-        # 2. Extract metadata using LLM
-        llm_extracted_metadata = self.pdf_parser.extract_metadata_with_llm(file_path)
-        if not llm_extracted_metadata:
-            logger.error(f"Failed to extract metadata for {file_path} using LLM. Cannot add paper.")
+        cached_parse = self.parse_cache.get(file_path, self.chunk_size, self.chunk_overlap)
+        if cached_parse:
+            # 2-3. The file is unchanged since it was last parsed: reuse its metadata and sections
+            logger.info(f"Using cached parse result for '{file_path}'.")
+            extracted_metadata = cached_parse["metadata"]
+            sections_data = cached_parse["sections"]
+            embeddings = None
+            if sections_data:
+                embeddings = self._get_embeddings_cached([sec["content"] for sec in sections_data])
+        else:
+            if pages is None:
+                reader = self.pdf_parser.open_pdf(file_path)
+                if not reader:
+                    logger.error(f"Could not open PDF '{file_path}'. Cannot add paper.")
+                    return None
+                pdf_metadata = self.pdf_parser.extract_metadata_from_pdf(file_path, reader=reader)
+                try:
+                    first_pages = list(self.pdf_parser.iter_pages(file_path, reader=reader, stop=2))
+                except Exception as e:
+                    logger.error(f"Error extracting text from PDF '{file_path}': {e}")
+                    return None
+                pages = chain(first_pages, self.pdf_parser.iter_pages(file_path, reader=reader, start=len(first_pages)))
+            else:
+                first_pages = pages[:2]
+            context_text = "\n".join(text for _, text in first_pages if text)
+
+            # 2. Take the metadata from the PDF's document info when it looks reliable; otherwise
+            #    extract it using LLM from the first two pages, in the background so the network
+            #    round trip overlaps with local section extraction and embedding (step 3)
+            extracted_metadata = None
+            if pdf_metadata is not None:
+                extracted_metadata = self.pdf_parser.extract_metadata_from_document_info(
+                    file_path, pdf_metadata, context_text
+                )
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                metadata_future = None
+                if not extracted_metadata:
+                    metadata_future = executor.submit(
+                        self.pdf_parser.extract_metadata_with_llm, file_path, context_text
+                    )
+
+                # 3. Extract sections and generate embeddings
+                sections_data, embeddings, sections_complete = self._extract_and_embed_sections(file_path, pages)
+
+                if metadata_future:
+                    extracted_metadata = metadata_future.result()
+            if not sections_complete:
+                # Storing the sections read before the error would leave a truncated paper that
+                # adding the file again never re-parses, since it is then already in the library
+                logger.error(f"Text extraction from '{file_path}' failed partway. Cannot add paper.")
+                return None
+        if not extracted_metadata:
+            logger.error(f"Failed to extract metadata for {file_path}. Cannot add paper.")
             return None
 
         # Use extracted metadata; fallback to generic values if LLM fails for a field
-        paper_title = llm_extracted_metadata.get("title", os.path.basename(file_path).replace(".pdf", "")).strip()
-        paper_authors = llm_extracted_metadata.get("authors", "Unknown Authors").strip()
-        paper_abstract = llm_extracted_metadata.get("abstract", "No abstract extracted.").strip()
+        paper_title = extracted_metadata.get("title", os.path.basename(file_path).replace(".pdf", "")).strip()
+        paper_authors = extracted_metadata.get("authors", "Unknown Authors").strip()
+        paper_abstract = extracted_metadata.get("abstract", "No abstract extracted.").strip()
         # publication_year, doi, url are harder for LLM to consistently extract without more context/prompt engineering
         # For now, we might leave them as None or try to extract from pypdf metadata first
         # We'll use a placeholder for year if LLM doesn't provide it
         # For simplicity, we'll keep the year as a placeholder for now
-        paper_year = int(llm_extracted_metadata.get("publication_year", 0))  # Assuming LLM *could* return this
-        if paper_year == 0:  # Fallback if LLM didn't find it
-            metadata_pypdf = self.pdf_parser.extract_metadata_from_pdf(file_path)
-            if (
-                "/CreationDate" in metadata_pypdf
-                and metadata_pypdf["/CreationDate"]
-                and len(metadata_pypdf["/CreationDate"]) >= 5
-            ):
-                try:
-                    paper_year = int(metadata_pypdf["/CreationDate"][2:6])  # e.g., 'D:20230101...'
-                except ValueError:
-                    pass
+        paper_year = int(extracted_metadata.get("publication_year", 0))  # Assuming LLM *could* return this
+        if paper_year == 0 and not cached_parse:  # Fallback if LLM didn't find it (already tried if cached)
+            metadata_pypdf = pdf_metadata
+            if metadata_pypdf is None:
+                metadata_pypdf = self.pdf_parser.extract_metadata_from_pdf(file_path)
+            creation_date = _CREATION_YEAR_RE.match(metadata_pypdf.get("creation_date") or "")
+            paper_year = int(creation_date.group(1)) if creation_date else 0
+        if not cached_parse:
+            # Cache the year found in the PDF too, so a cache hit never reopens the file
+            cached_metadata = dict(extracted_metadata, publication_year=paper_year)
+            self.parse_cache.put(file_path, self.chunk_size, self.chunk_overlap, cached_metadata, sections_data)
         if paper_year == 0:
             paper_year = datetime.now().year  # Default to current year if all else fails
 
-        # 3. Add paper entry to DB
-        paper_id = self.db_manager.add_paper(
+        if not sections_data:
+            logger.warning(f"No sections extracted for paper '{paper_title}'. Skipping embedding and section storage.")
+        elif embeddings is None:
+            logger.error(
+                f"Failed to generate embeddings for all sections of '{paper_title}'. Storing sections without embeddings."
+            )
+
+        # 4. Store the paper, its sections and its packed embedding matrix in one transaction
+        paper_id = self.db_manager.add_paper_with_sections(
             title=paper_title,
+            file_path=file_path,
+            sections=sections_data,
+            embeddings=embeddings,
             authors=paper_authors,
             publication_year=paper_year,
             abstract=paper_abstract,
-            file_path=file_path,
         )
         if not paper_id:
             logger.error(f"Failed to add paper '{paper_title}' to database.")
             return None
 
-        logger.info(f"Paper '{paper_title}' (ID: {paper_id}) added to DB metadata.")
+        return paper_id
 
-        # 4. Extract sections and generate embeddings
-        sections_data = self.pdf_parser.extract_sections_from_pdf(
-            file_path, chunk_size=self.chunk_size, overlap=self.chunk_overlap
-        )
-        if not sections_data:
-            logger.warning(f"No sections extracted for paper '{paper_title}'. Skipping embedding and section storage.")
-            return paper_id  # Paper added, but no sections. Still a success.
+    def add_papers_from_files(self, file_paths: List[str], workers: Optional[int] = None) -> Dict[str, Optional[int]]:
+        """
+        Adds many papers, extracting their page text in parallel worker processes.
+        Each paper is stored as soon as its pages are ready, in this process, which
+        owns the embedding model; up to LLM_MAX_CONCURRENCY papers are stored at once,
+        so their metadata LLM round trips overlap instead of running back to back.
+        A new extraction starts only when an earlier paper is done, so at most one page
+        set per worker and store thread is held in memory however many files are given.
 
-        section_contents = [sec["content"] for sec in sections_data]
-        embeddings = self.embedding_model.get_embedding(section_contents)
+        Args:
+            file_paths (List[str]): The absolute paths to the PDF files.
+            workers (Optional[int]): Number of worker processes; defaults to one less than
+                                     the CPU count, at most 8.
 
-        if embeddings is None or embeddings.shape[0] != len(sections_data):
-            logger.error(
-                f"Failed to generate embeddings for all sections of '{paper_title}'. Storing sections without embeddings."
-            )
-            # Store sections without embeddings if embedding generation fails
-            for section in sections_data:
-                self.db_manager.add_section(paper_id=paper_id, **section, embedding=None)
-        else:
-            for i, section in enumerate(sections_data):
-                self.db_manager.add_section(
-                    paper_id=paper_id,
-                    section_title=section["section_title"],
-                    content=section["content"],
-                    page_number=section["page_number"],
-                    embedding=embeddings[i],
-                )
-            logger.info(f"Stored {len(sections_data)} sections with embeddings for paper '{paper_title}'.")
+        Returns:
+            Dict[str, Optional[int]]: The paper ID for each file path, or None if adding it failed.
+        """
+        results: Dict[str, Optional[int]] = {}
+        pending = []
+        for file_path in dict.fromkeys(file_paths):  # Once each, so no two threads store the same file
+            existing_paper = self.db_manager.get_paper_by_filepath(file_path)
+            if existing_paper:
+                logger.warning(f"Paper from '{file_path}' already exists in DB (ID: {existing_paper['id']}). Skipping.")
+                results[file_path] = existing_paper["id"]
+            elif self.parse_cache.get(file_path, self.chunk_size, self.chunk_overlap):
+                results[file_path] = self.add_paper_from_file(file_path)  # Parsed before; nothing to extract
+            else:
+                pending.append(file_path)
+        if not pending:
+            return results
+
+        if workers is None:
+            workers = min((os.cpu_count() or 1) - 1, _MAX_INGEST_WORKERS)
+        max_workers = max(1, min(len(pending), workers))
+        store_workers = max(1, min(len(pending), int(config.get("LLM_MAX_CONCURRENCY", 8))))
+        logger.info(f"Extracting text from {len(pending)} PDFs with {max_workers} worker processes.")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor, ThreadPoolExecutor(
+            max_workers=store_workers
+        ) as store_executor:
+            queued = iter(pending)
+            extractions: Dict[Future, str] = {}
+            stores: Dict[Future, str] = {}
+
+            def extract_next() -> None:
+                file_path = next(queued, None)
+                if file_path is not None:
+                    extractions[executor.submit(extract_pdf, file_path)] = file_path
+
+            for _ in range(max_workers + store_workers):
+                extract_next()
+            while extractions or stores:
+                done, _ = wait([*extractions, *stores], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in extractions:
+                        file_path = extractions.pop(future)
+                        try:
+                            pdf_metadata, pages = future.result()
+                        except Exception as e:
+                            logger.error(f"Error extracting text from PDF '{file_path}': {e}")
+                            results[file_path] = None
+                            extract_next()
+                            continue
+                        store_future = store_executor.submit(
+                            self.add_paper_from_file, file_path, pages=pages, pdf_metadata=pdf_metadata
+                        )
+                        stores[store_future] = file_path
+                    else:
+                        file_path = stores.pop(future)
+                        try:
+                            results[file_path] = future.result()
+                        except Exception as e:
+                            logger.error(f"Error adding paper from '{file_path}': {e}")
+                            results[file_path] = None
+                        extract_next()
+
+        return results
+
+    def _extract_and_embed_sections(
+        self, file_path: str, pages: Optional[Iterable[Tuple[int, str]]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[np.ndarray], bool]:
+        """
+        Chunks a PDF and embeds its sections with parsing and embedding overlapped:
+        a producer thread parses pages (or walks the given pages) and queues batches
+        of sections while this thread embeds each batch as it arrives.
 
-        return paper_id
+        Returns (sections, embeddings, complete); embeddings is None if any batch failed to
+        embed, and complete is False if parsing failed partway (sections then holds what was
+        extracted before the error).
+        """
+        batches: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=_EMBED_QUEUE_SIZE)
+
+        batch_size = self.embedding_model.batch_size
+        extraction_failed = False
+
+        def produce() -> None:
+            nonlocal extraction_failed
+            batch = []
+            try:
+                for section in self.pdf_parser.iter_sections(
+                    file_path, chunk_size=self.chunk_size, overlap=self.chunk_overlap, pages=pages
+                ):
+                    batch.append(section)
+                    if len(batch) == batch_size:
+                        batches.put(batch)
+                        batch = []
+                if batch:
+                    batches.put(batch)
+            except Exception as e:
+                logger.error(f"Error extracting sections from '{file_path}': {e}")
+                extraction_failed = True
+            finally:
+                batches.put(None)  # Sentinel: no more batches
+
+        producer = threading.Thread(target=produce, name="section-producer", daemon=True)
+        producer.start()
+
+        sections: List[Dict[str, Any]] = []
+        embedded: List[np.ndarray] = []
+        embedding_failed = False
+        while (batch := batches.get()) is not None:
+            sections.extend(batch)
+            if embedding_failed:
+                continue  # Keep draining so the producer never blocks on a full queue
+            batch_embeddings = self._get_embeddings_cached([sec["content"] for sec in batch])
+            if batch_embeddings is None or batch_embeddings.shape[0] != len(batch):
+                embedding_failed = True
+                continue
+            embedded.append(batch_embeddings)
+        producer.join()
+
+        if not sections or embedding_failed:
+            return sections, None, not extraction_failed
+        return sections, np.vstack(embedded), not extraction_failed
+
+    def _get_embeddings_cached(self, contents: List[str]) -> Optional[np.ndarray]:
+        """
+        Embeds texts, running the embedding model only on texts missing from the
+        database embedding cache and caching the new vectors.
+        Returns a (len(contents), dim) float32 array, or None if embedding failed.
+        """
+        model_key = self.embedding_model.model_name.encode() + b"\0"
+        hashes = [hashlib.blake2b(model_key + text.encode(), digest_size=16).digest() for text in contents]
+        cached = self.db_manager.get_cached_embeddings(hashes)
+
+        missing = [i for i, content_hash in enumerate(hashes) if content_hash not in cached]
+        if missing:
+            new_embeddings = self.embedding_model.get_embedding([contents[i] for i in missing])
+            if new_embeddings is None or new_embeddings.shape[0] != len(missing):
+                return None
+            new_entries = [(hashes[i], embedding) for i, embedding in zip(missing, new_embeddings)]
+            self.db_manager.add_cached_embeddings(new_entries)
+            cached.update(new_entries)
+        logger.debug(f"Embedding cache: {len(contents) - len(missing)} hits, {len(missing)} misses.")
+
+        return np.stack([cached[content_hash] for content_hash in hashes])
 
     def query_papers_rag(self, query: str, top_k_sections: int = 5) -> Dict[str, Any]:
         """
@@ -151,11 +402,76 @@ class PaperManager:
                             retrieved sections used as context.
         """
         logger.info(f"Processing RAG query: '{query}'")
-        retrieved_sections = self.retriever.retrieve_relevant_sections(query, top_k=top_k_sections)
+        query_embedding = self.retriever.embed_query(query)
+        version = self.db_manager.embeddings_version()
+        if query_embedding is not None:
+            cached = self.answer_cache.get(query_embedding, top_k_sections, version)
+            if cached:
+                return {**cached, "query": query}
+
+        retrieved_sections = self.retriever.retrieve_relevant_sections(
+            query, top_k=top_k_sections, query_embedding=query_embedding
+        )
 
         answer = self.generator.generate_answer(query, retrieved_sections)
 
-        return {"query": query, "answer": answer, "retrieved_sections": retrieved_sections}
+        result = {"query": query, "answer": answer, "retrieved_sections": retrieved_sections}
+        if query_embedding is not None and retrieved_sections and answer != GENERATION_ERROR_ANSWER:
+            self.answer_cache.put(query_embedding, top_k_sections, version, result)
+        return result
+
+    @staticmethod
+    def _group_into_windows(texts: List[str], max_chars: int) -> List[str]:
+        """
+        Packs consecutive texts into windows of at most max_chars characters each
+        (a single text longer than that is split across windows).
+        """
+        windows, current, current_len = [], [], 0
+        for text in texts:
+            for start in range(0, max(len(text), 1), max_chars):
+                piece = text[start : start + max_chars]
+                if current and current_len + len(piece) + 2 > max_chars:
+                    windows.append("\n\n".join(current))
+                    current, current_len = [], 0
+                current.append(piece)
+                current_len += len(piece) + 2
+        if current:
+            windows.append("\n\n".join(current))
+        return windows
+
+    def _condense_for_summary(self, texts: List[str], max_chars: int) -> Optional[str]:
+        """
+        Returns the texts joined into one summary context of at most max_chars characters.
+        While they do not fit, they are grouped into max_chars windows and each window is
+        replaced by a partial summary, generated concurrently ("map"); the final summary
+        prompt then "reduces" the partial summaries. Returns None if every partial summary failed.
+        """
+        context = "\n\n".join(texts)
+        while len(context) > max_chars:
+            windows = self._group_into_windows(texts, max_chars)
+            logger.info(f"Context too long ({len(context)} chars); summarizing it as {len(windows)} parts.")
+            prompts = [
+                _PARTIAL_SUMMARY_TEMPLATE.format_map({"part": i, "total": len(windows), "excerpt": window})
+                for i, window in enumerate(windows, 1)
+            ]
+            partials = self.llm.generate_text_batch(
+                prompts,
+                max_tokens=config.get("LLM_MAX_TOKENS_FOR_PARTIAL_SUMMARY", 300),
+                temperature=0.3,
+                cache_key=_PARTIAL_SUMMARY_CACHE_KEY,
+            )
+            partials = [partial for partial in partials if partial]
+            if not partials:
+                return None
+            if len(partials) < len(windows):
+                logger.warning(f"{len(windows) - len(partials)} of {len(windows)} partial summaries failed.")
+
+            condensed = "\n\n".join(partials)
+            if len(condensed) >= len(context):  # No progress; avoid looping forever
+                logger.warning(f"Partial summaries did not shorten the context. Truncating to {max_chars} chars.")
+                return condensed[:max_chars] + "\n\n[...truncated for brevity...]"
+            texts, context = partials, condensed
+        return context
 
     def summarize_paper(self, paper_id: int) -> Optional[str]:
         """
@@ -187,34 +503,23 @@ class PaperManager:
         if not sections:
             logger.warning(f"No sections found for paper ID {paper_id}. Cannot summarize comprehensively.")
             # Fallback to abstract if no sections
-            prompt_context = paper["abstract"] if paper["abstract"] else "No content available."
+            texts = [paper["abstract"] if paper["abstract"] else "No content available."]
         else:
-            # Join all section contents. Need to be mindful of LLM context window.
-            # For very long papers, a more advanced summarization (e.g., hierarchical) might be needed.
-            prompt_context = "\n\n".join([sec["content"] for sec in sections])
-
-        # Limit context size to LLM's capacity (e.g., 16k tokens)
-        MAX_CONTEXT_CHARS = config.get("LLM_MAX_CONTEXT_CHARS_FOR_SUMMARY", 10000)  # Roughly 2k-3k tokens
-        if len(prompt_context) > MAX_CONTEXT_CHARS:
-            logger.warning(
-                f"Context for summarization too long ({len(prompt_context)} chars). Truncating to {MAX_CONTEXT_CHARS} chars."
-            )
-            prompt_context = prompt_context[:MAX_CONTEXT_CHARS] + "\n\n[...truncated for brevity...]"
-
-        summary_prompt = f"""
-        Please provide a comprehensive and concise summary of the following academic paper.
-        Focus on the main objectives, methodology, key findings, and conclusions.
-        Ensure the summary is easy to understand for a non-expert, yet captures the essence of the research.
+            texts = [sec.content for sec in sections]
 
-        Paper Content:
-        ---
-        {prompt_context}
-        ---
+        # Papers longer than the LLM's context budget are condensed map-reduce style instead of truncated
+        max_context_chars = config.get("LLM_MAX_CONTEXT_CHARS_FOR_SUMMARY", 10000)  # Roughly 2k-3k tokens
+        prompt_context = self._condense_for_summary(texts, max_context_chars)
+        if prompt_context is None:
+            logger.error(f"Failed to condense paper '{paper['title']}' (ID: {paper_id}) for summarization.")
+            return None
 
-        Comprehensive Summary:
-        """
+        summary_prompt = _SUMMARY_TEMPLATE.format_map({"context": prompt_context})
         summary = self.llm.generate_text(
-            summary_prompt, max_tokens=config.get("LLM_MAX_TOKENS_FOR_SUMMARY", 750), temperature=0.5
+            summary_prompt,
+            max_tokens=config.get("LLM_MAX_TOKENS_FOR_SUMMARY", 750),
+            temperature=0.5,
+            cache_key=_SUMMARY_CACHE_KEY,
         )
 
         if summary:
@@ -227,9 +532,9 @@ class PaperManager:
 
     def list_all_papers(self) -> List[Dict[str, Any]]:
         """
-        Retrieves a list of all papers in the database.
+        Retrieves a list of all papers in the database (listing columns only).
         """
-        return self.db_manager.get_all_papers()
+        return self.db_manager.list_papers_brief()
 
     def get_paper_details(self, paper_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -251,6 +556,12 @@ class PaperManager:
             return self.db_manager.add_paper_tag(paper_id, tag_id)
         return False
 
+    def add_tags_to_paper(self, paper_id: int, tag_names: List[str]) -> bool:
+        """
+        Adds several tags to a paper at once. Creates the tags that don't exist.
+        """
+        return self.db_manager.add_paper_tags(paper_id, tag_names)
+
     def remove_tag_from_paper(self, paper_id: int, tag_name: str) -> bool:
         """
         Removes a tag from a paper.
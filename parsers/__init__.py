@@ -1 +1,2 @@
-from .pdf_parser import PDFParser
\ No newline at end of file
+from .pdf_parser import PDFParser
+from .parse_cache import ParseCache
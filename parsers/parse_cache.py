@@ -0,0 +1,92 @@
+# paper_agent/parsers/parse_cache.py
+
+import hashlib
+import os
+import pickle
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+from parsers.pdf_parser import metadata_settings_key, text_backend_name
+from utils.config import config
+from utils.logger import logger
+
+# Bump when parsing, chunking or the metadata prompt change in a way that invalidates cached results.
+_CACHE_VERSION = 2
+
+
+class ParseCache:
+    """
+    On-disk cache of per-file parse results (extracted metadata and chunked sections),
+    so re-ingesting an unchanged PDF skips both text extraction and the LLM metadata call.
+    Entries are content-addressed: one pickle per SHA-256 of the file's bytes, text extraction
+    backend, metadata settings (LLM model, prompt, TRUST_PDF_METADATA) and chunking parameters
+    under <DB_DIR>/parse_cache, so a renamed or copied PDF hits the cache too, while changing
+    any of those settings parses the file again.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or os.path.join(config.get("DB_DIR"), "parse_cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # file_path -> ((st_mtime_ns, st_size), sha256 hex), so an unchanged file is hashed only once
+        self._hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._hashes_lock = threading.Lock()
+        logger.info(f"ParseCache initialized at: {self.cache_dir}")
+
+    def content_hash(self, file_path: str) -> str:
+        """
+        Returns the SHA-256 hex digest of a file's bytes, reusing the last digest while the
+        file's modification time and size are unchanged.
+        """
+        stat = os.stat(file_path)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        with self._hashes_lock:
+            known = self._hashes.get(file_path)
+        if known and known[0] == stat_key:
+            return known[1]
+
+        with open(file_path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        with self._hashes_lock:
+            self._hashes[file_path] = (stat_key, digest)
+        return digest
+
+    def _entry_path(self, file_path: str, chunk_size: int, overlap: int) -> str:
+        settings = f"{text_backend_name()}-{metadata_settings_key()}-{chunk_size}-{overlap}"
+        name = f"{self.content_hash(file_path)}-{settings}.pkl"
+        return os.path.join(self.cache_dir, name)
+
+    def get(self, file_path: str, chunk_size: int, overlap: int) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached {'metadata': ..., 'sections': ...} for a file's content, or None if
+        there is no entry for it with these chunking parameters.
+        """
+        try:
+            with open(self._entry_path(file_path, chunk_size, overlap), "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache entry for '{file_path}': {e}")
+            return None
+
+        if entry.get("version") != _CACHE_VERSION or not entry.get("metadata", {}).get("title"):
+            logger.debug(f"Parse cache entry for '{file_path}' is outdated.")
+            return None
+        return entry
+
+    def put(
+        self, file_path: str, chunk_size: int, overlap: int, metadata: Dict[str, Any], sections: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Stores the parse result of a file. Failures are logged and otherwise ignored.
+        """
+        try:
+            entry_path = self._entry_path(file_path, chunk_size, overlap)
+            temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            entry = {"version": _CACHE_VERSION, "metadata": metadata, "sections": sections}
+            with open(temp_path, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)  # Atomic, so readers never see a partial entry
+            logger.debug(f"Cached parse result for '{file_path}' ({len(sections)} sections).")
+        except Exception as e:
+            logger.warning(f"Failed to cache parse result for '{file_path}': {e}")
@@ -1,20 +1,252 @@
 # paper_agent/parsers/pdf_parser.py
 
 from pypdf import PdfReader
+import hashlib
+import importlib
 import os
-from typing import List, Dict, Any, Optional
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 import json
 
+from utils.config import config
 from utils.logger import logger
 
 # Import LLMInterface
 from llm.llm_interface import LLMInterface
 
 
+# Abstract of a paper in the text of its first pages: everything after an "Abstract" heading up
+# to the introduction (or keywords) heading, e.g. "1 Introduction", "I. INTRODUCTION".
+_ABSTRACT_RE = re.compile(
+    r"\babstract\b[\s.:\u2013\u2014-]*(?P<abstract>.+?)\n\s*(?:(?:\d+|[IVX]+)\.?\s*)?"
+    r"(?:introduction|keywords|key words|index terms|ccs concepts)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+# Document titles that authoring tools fill in rather than the authors.
+_PLACEHOLDER_TITLE_RE = re.compile(
+    r"untitled|microsoft (?:word|powerpoint)\b|.*\.(?:docx?|tex|dvi|pdf|ps)$", re.IGNORECASE
+)
+
+# Metadata extraction prompt. The instructions before {text} are identical for every paper,
+# so providers can serve them from their prompt cache; their hash keys that cache.
+_METADATA_PROMPT_TEMPLATE = (
+    "You are an expert in academic paper analysis. Your task is to extract key metadata from the provided text, "
+    "which typically comes from the first few pages of a research paper.\n"
+    "Identify the paper's title, a comma-separated list of authors, the full abstract, "
+    "and a very short (1-2 sentences) summary of the abstract.\n"
+    "Return the information in a JSON object with the following keys:\n"
+    '- "title": (string) The full title of the paper.\n'
+    '- "authors": (string) A comma-separated list of all authors.\n'
+    '- "abstract": (string) The complete abstract of the paper.\n'
+    '- "abstract_summary": (string) A concise, 1-2 sentence summary of the abstract.\n'
+    "\n"
+    'If any piece of information is not clearly present in the text, use "N/A" for that field.\n'
+    "\n"
+    "Paper Text:\n"
+    "---\n"
+    "{text}\n"
+    "---\n"
+)
+_METADATA_PROMPT_CACHE_KEY = (
+    "metadata-" + hashlib.sha256(_METADATA_PROMPT_TEMPLATE.partition("{")[0].encode()).hexdigest()[:16]
+)
+
+# Pages handed to each worker process when a single PDF is extracted in parallel;
+# PDFs with fewer than two tasks' worth of pages are extracted serially.
+_PAGES_PER_TASK = 4
+
+
+# Optional text extraction backends (PDF_BACKEND) and the module each needs; both are several
+# times faster than pypdf, which is used when the configured one is not installed.
+_TEXT_BACKEND_MODULES = {"pdfium": "pypdfium2", "pymupdf": "pymupdf"}
+
+
+@lru_cache(maxsize=None)
+def _text_backend() -> Tuple[str, Any]:
+    """
+    Returns (backend, module) for extracting page text: the PDF_BACKEND config value ("pdfium"
+    or "pymupdf") and its imported module, or ("pypdf", None) to use pypdf, the default.
+    Metadata is always read with pypdf.
+    """
+    backend = config.get("PDF_BACKEND", "pypdf")
+    module_name = _TEXT_BACKEND_MODULES.get(backend)
+    if module_name is None:
+        if backend != "pypdf":
+            logger.warning(f"Unknown PDF_BACKEND '{backend}'; extracting PDF text with pypdf.")
+        return "pypdf", None
+    try:
+        return backend, importlib.import_module(module_name)
+    except ImportError:
+        logger.warning(f"PDF_BACKEND is '{backend}' but {module_name} is not installed; extracting PDF text with pypdf.")
+        return "pypdf", None
+
+
+def text_backend_name() -> str:
+    """
+    Returns the name of the backend page text is actually extracted with ("pdfium", "pymupdf"
+    or "pypdf"), so cached parse results can be tied to it.
+    """
+    return _text_backend()[0]
+
+
+def metadata_settings_key() -> str:
+    """
+    Returns a short digest of the settings extracted metadata depends on (LLM_MODEL_NAME, the
+    metadata prompt and TRUST_PDF_METADATA), so cached metadata can be tied to them.
+    """
+    settings = (config.get("LLM_MODEL_NAME"), _METADATA_PROMPT_TEMPLATE, bool(config.get("TRUST_PDF_METADATA", True)))
+    return hashlib.sha256(repr(settings).encode()).hexdigest()[:12]
+
+
+def _iter_pdfium_page_texts(
+    pdfium, pdf_path: str, start: int = 0, stop: Optional[int] = None
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yields (page_number, text) for pages [start, stop) using PDFium.
+    PDFium is not thread-safe, so a document must only be read from one thread at a time.
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        stop = len(pdf) if stop is None else min(stop, len(pdf))
+        for page_idx in range(start, stop):
+            page = pdf[page_idx]
+            textpage = page.get_textpage()
+            try:
+                # PDFium ends lines with "\r\n"; normalize so chunking sees the same text as with pypdf
+                yield page_idx + 1, textpage.get_text_range().replace("\r\n", "\n")
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def _iter_pymupdf_page_texts(
+    pymupdf, pdf_path: str, start: int = 0, stop: Optional[int] = None
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yields (page_number, text) for pages [start, stop) using MuPDF.
+    """
+    with pymupdf.open(pdf_path) as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        for page_idx in range(start, stop):
+            yield page_idx + 1, doc.load_page(page_idx).get_text("text")
+
+
+def _iter_page_texts(
+    pdf_path: str, reader: Optional[PdfReader] = None, start: int = 0, stop: Optional[int] = None
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yields (page_number, text) for pages [start, stop) with the configured backend.
+    `reader` is only used (instead of opening the file again) by the pypdf backend.
+    """
+    backend, module = _text_backend()
+    if backend == "pdfium":
+        yield from _iter_pdfium_page_texts(module, pdf_path, start, stop)
+        return
+    if backend == "pymupdf":
+        yield from _iter_pymupdf_page_texts(module, pdf_path, start, stop)
+        return
+    reader = reader or PdfReader(pdf_path)
+    stop = len(reader.pages) if stop is None else min(stop, len(reader.pages))
+    for page_idx in range(start, stop):
+        yield page_idx + 1, reader.pages[page_idx].extract_text()
+
+
+def extract_page_texts(pdf_path: str, start: int = 0, stop: Optional[int] = None) -> List[Tuple[int, str]]:
+    """
+    Extracts (page_number, text) for pages [start, stop) of a PDF (0-indexed bounds,
+    1-indexed page numbers); all pages by default.
+    Module-level so it can be run in a worker process, which opens its own document.
+    """
+    return list(_iter_page_texts(pdf_path, start=start, stop=stop))
+
+
+def _reader_metadata(reader: PdfReader) -> Dict[str, Any]:
+    """
+    Returns pypdf's document info of an open reader as a plain dictionary.
+    """
+    metadata = reader.metadata or {}  # PDFs without an info dictionary have no metadata
+    return {
+        "title": metadata.get("/Title"),
+        "author": metadata.get("/Author"),
+        "creator": metadata.get("/Creator"),
+        "producer": metadata.get("/Producer"),
+        "creation_date": metadata.get("/CreationDate"),
+        "mod_date": metadata.get("/ModDate"),
+        "keywords": metadata.get("/Keywords"),
+        # Add more fields as needed
+    }
+
+
+def extract_pdf(pdf_path: str) -> Tuple[Dict[str, Any], List[Tuple[int, str]]]:
+    """
+    Opens a PDF once and returns (metadata, [(page_number, text), ...]) for all pages.
+    Module-level so a whole PDF can be extracted in a worker process.
+    """
+    reader = PdfReader(pdf_path)
+    return _reader_metadata(reader), list(_iter_page_texts(pdf_path, reader))
+
+
+def _truncate_at_word(text: str, max_chars: int) -> str:
+    """
+    Returns text cut to at most max_chars characters, ending at a whitespace boundary when one
+    is in the second half, so the LLM never sees a word (and its tokens) cut in half.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = max(text.rfind(" ", max_chars // 2, max_chars + 1), text.rfind("\n", max_chars // 2, max_chars + 1))
+    return text[: cut if cut != -1 else max_chars].rstrip()
+
+
+def _cut_chunks(text: str, chunk_size: int, overlap: int, final: bool) -> Tuple[List[Tuple[int, str]], int]:
+    """
+    Cuts text into chunks of up to chunk_size characters, preferring to end a chunk just after
+    a '.' or newline in its last quarter, and otherwise stepping back by overlap.
+    Returns ([(start_offset, chunk), ...], resume_offset). Unless final, the trailing chunk that
+    could still change once more text arrives is left uncut and resume_offset is where it starts.
+    """
+    chunks = []
+    # A split point only counts if it is more than 75% into the chunk, so only that tail is searched
+    min_split_offset = int(chunk_size * 0.75) + 1
+    text_len = len(text)
+    start_idx = 0
+    while start_idx < text_len:
+        end_idx = start_idx + chunk_size
+
+        # Attempt to find a natural break (e.g., end of sentence)
+        # This is a very basic attempt; real-world parsing might need NLP
+        if end_idx < text_len:
+            # Searched in place with bounded rfind calls, so each chunk is sliced exactly once
+            split_start_idx = start_idx + min_split_offset
+            split_idx = max(text.rfind(".", split_start_idx, end_idx), text.rfind("\n", split_start_idx, end_idx))
+
+            if split_idx != -1:  # If a good split point is near the end
+                end_idx = split_idx + 1
+                next_start_idx = end_idx
+            else:
+                next_start_idx = start_idx + chunk_size - overlap  # Move back by overlap
+        elif not final:
+            break  # Wait for more text before cutting the remainder
+        else:
+            next_start_idx = end_idx  # Process remaining chunk
+
+        chunk = text[start_idx:end_idx].strip()
+        if chunk:  # Add only non-empty chunks
+            chunks.append((start_idx, chunk))
+        start_idx = next_start_idx
+    return chunks, start_idx
+
+
 class PDFParser:
     """
     A class for parsing PDF files, extracting text content, and metadata.
-    Uses the pypdf library and leverages an LLM for enhanced metadata extraction.
+    Uses pypdfium2, PyMuPDF or pypdf (see PDF_BACKEND) for text and pypdf for metadata,
+    and leverages an LLM for enhanced metadata extraction.
     """
 
     def __init__(self, llm_interface: LLMInterface):
@@ -25,16 +257,24 @@ class PDFParser:
         """
         Helper to get a PdfReader object for a given PDF path.
         """
-        if not os.path.exists(pdf_path):
-            logger.error(f"PDF file not found: {pdf_path}")
-            return None
         try:
             reader = PdfReader(pdf_path)
             return reader
+        except FileNotFoundError:
+            logger.error(f"PDF file not found: {pdf_path}")
+            return None
         except Exception as e:
             logger.error(f"Error opening or reading PDF '{pdf_path}': {e}")
             return None
 
+    def open_pdf(self, pdf_path: str) -> Optional[PdfReader]:
+        """
+        Opens a PDF so several extraction steps can share one reader (the `reader`
+        argument of the extract/iter methods) instead of each re-parsing the file.
+        Returns None if the file cannot be opened.
+        """
+        return self._get_pdf_reader(pdf_path)
+
     def extract_text_from_pdf(self, pdf_path: str) -> Optional[str]:
         """
         Extracts all text content from a PDF file.
@@ -43,11 +283,8 @@ class PDFParser:
         if not reader:
             return None
 
-        full_text = []
         try:
-            for page in reader.pages:
-                full_text.append(page.extract_text())
-            return "\n".join(full_text)
+            return "\n".join(text for _, text in _iter_page_texts(pdf_path, reader) if text)
         except Exception as e:
             logger.error(f"Error extracting text from PDF '{pdf_path}': {e}")
             return None
@@ -61,73 +298,47 @@ class PDFParser:
         if not reader:
             return None
 
-        extracted_text = []
         try:
             # Adjust to 0-indexed for pypdf
             start_idx = max(0, start_page - 1)
             end_idx = min(len(reader.pages), end_page)
 
-            for i in range(start_idx, end_idx):
-                page = reader.pages[i]
-                text = page.extract_text()
-                if text:
-                    extracted_text.append(text)
-            return "\n".join(extracted_text)
+            return "\n".join(text for _, text in _iter_page_texts(pdf_path, reader, start_idx, end_idx) if text)
         except Exception as e:
             logger.error(f"Error extracting text from page range {start_page}-{end_page} of PDF '{pdf_path}': {e}")
             return None
 
-    def extract_metadata_from_pdf(self, pdf_path: str) -> Dict[str, Any]:
+    def extract_metadata_from_pdf(self, pdf_path: str, reader: Optional[PdfReader] = None) -> Dict[str, Any]:
         """
         Extracts basic metadata (like title, author) from a PDF file using pypdf's built-in capabilities.
         This serves as a fallback or initial quick check.
+        Uses `reader` if given instead of opening the file again.
         Returns a dictionary with metadata.
         """
-        reader = self._get_pdf_reader(pdf_path)
+        reader = reader or self._get_pdf_reader(pdf_path)
         if not reader:
             return {}
+        return _reader_metadata(reader)
 
-        metadata = reader.metadata
-        return {
-            "title": metadata.get("/Title"),
-            "author": metadata.get("/Author"),
-            "creator": metadata.get("/Creator"),
-            "producer": metadata.get("/Producer"),
-            "creation_date": metadata.get("/CreationDate"),
-            "mod_date": metadata.get("/ModDate"),
-            "keywords": metadata.get("/Keywords"),
-            # Add more fields as needed
-        }
-
-    def extract_metadata_with_llm(self, pdf_path: str) -> Optional[Dict[str, Any]]:
+    def extract_metadata_with_llm(self, pdf_path: str, context_text: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Extracts structured metadata (title, authors, abstract, abstract summary)
         from the first few pages of a PDF using an LLM.
+        `context_text` is the text of those pages if the caller already has it;
+        otherwise the first two pages are read from pdf_path.
         """
         # Extract text from the first two pages
-        context_text = self.extract_text_from_page_range(pdf_path, start_page=1, end_page=2)
+        if context_text is None:
+            context_text = self.extract_text_from_page_range(pdf_path, start_page=1, end_page=2)
         if not context_text:
             logger.error(f"Could not extract text from first two pages of {pdf_path} for LLM metadata extraction.")
             return None
 
-        prompt = f"""
-        You are an expert in academic paper analysis. Your task is to extract key metadata from the provided text, which typically comes from the first few pages of a research paper.
-        Identify the paper's title, a comma-separated list of authors, the full abstract, and a very short (1-2 sentences) summary of the abstract.
-        Return the information in a JSON object with the following keys:
-        - "title": (string) The full title of the paper.
-        - "authors": (string) A comma-separated list of all authors.
-        - "abstract": (string) The complete abstract of the paper.
-        - "abstract_summary": (string) A concise, 1-2 sentence summary of the abstract.
-
-        If any piece of information is not clearly present in the text, use "N/A" for that field.
-
-        Paper Text:
-        ---
-        {context_text[:4000]} # Limit input to LLM to avoid very long contexts
-        ---
-        """
+        prompt = _METADATA_PROMPT_TEMPLATE.format_map(
+            {"text": _truncate_at_word(context_text, config.get("LLM_MAX_CONTEXT_CHARS_FOR_METADATA", 4000))}
+        )
         # Using generate_json for structured output
-        extracted_data = self.llm.generate_json(prompt)
+        extracted_data = self.llm.generate_json(prompt, cache_key=_METADATA_PROMPT_CACHE_KEY)
 
         if extracted_data:
             # Clean up common LLM artifacts or formatting issues
@@ -141,60 +352,152 @@ class PDFParser:
             logger.error(f"LLM failed to extract metadata for {pdf_path}.")
             return None
 
-    def extract_sections_from_pdf(self, pdf_path: str, chunk_size: int = 1000, overlap: int = 200) -> List[Dict[str, Any]]:
+    def extract_metadata_from_document_info(
+        self, pdf_path: str, pdf_metadata: Dict[str, Any], context_text: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
         """
-        Extracts text from a PDF and chunks it into manageable sections.
-        This is a simple chunking mechanism. More advanced methods (e.g., based on headings,
-        semantic similarity) might be needed for better RAG performance.
+        Builds the title/authors/abstract metadata without an LLM when the PDF's own document
+        info looks reliable: a plausible title (not the file name or an authoring tool's
+        placeholder), an author, and an "Abstract" section found in context_text (the first pages).
+        Returns None if any of these is missing, in which case extract_metadata_with_llm is needed.
+        """
+        if not config.get("TRUST_PDF_METADATA", True):
+            return None
 
-        Returns a list of dictionaries, each with 'content', 'page_number', 'section_title' (optional).
+        title = (pdf_metadata.get("title") or "").strip()
+        authors = (pdf_metadata.get("author") or "").strip()
+        file_stem = os.path.splitext(os.path.basename(pdf_path))[0]
+        if (
+            not 10 <= len(title) <= 300
+            or " " not in title
+            or title.lower() == file_stem.lower()
+            or _PLACEHOLDER_TITLE_RE.match(title)
+            or not authors
+        ):
+            return None
+
+        match = _ABSTRACT_RE.search(context_text or "")
+        abstract = " ".join(match.group("abstract").split()) if match else ""
+        if not 100 <= len(abstract) <= 5000:
+            return None
+
+        logger.info(f"Using the PDF's document info as metadata for '{title}' (no LLM call needed).")
+        return {"title": title, "authors": authors, "abstract": abstract}
+
+    def iter_pages(
+        self,
+        pdf_path: str,
+        workers: Optional[int] = None,
+        reader: Optional[PdfReader] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[int, str]]:
         """
-        reader = self._get_pdf_reader(pdf_path)
+        Yields (page_number, text) for pages [start, stop) of a PDF (0-indexed bounds,
+        1-indexed page numbers; all pages by default), in page order, so callers never
+        hold the text of the whole document at once.
+        Uses `reader` if given instead of opening the file again.
+        pypdf's text extraction is CPU-bound, so with that backend longer ranges are extracted
+        by up to `workers` processes (default: one less than the CPU count), each handling a few
+        pages. The native backends are fast enough that a pool would cost more than it saves.
+        An error while extracting is raised after the pages before it have been yielded,
+        so callers can tell a partial parse from a complete one.
+        """
+        reader = reader or self._get_pdf_reader(pdf_path)
         if not reader:
-            return []
+            return
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 1) - 1)
+
+        stop = len(reader.pages) if stop is None else min(stop, len(reader.pages))
+        if workers > 1 and stop - start >= 2 * _PAGES_PER_TASK and text_backend_name() == "pypdf":
+            starts = range(start, stop, _PAGES_PER_TASK)
+            stops = [min(task_start + _PAGES_PER_TASK, stop) for task_start in starts]
+            with ProcessPoolExecutor(max_workers=min(workers, len(starts))) as executor:
+                # map() returns results in submission order, so page numbers stay in sequence
+                for pages in executor.map(extract_page_texts, repeat(pdf_path), starts, stops):
+                    yield from pages
+        else:
+            yield from _iter_page_texts(pdf_path, reader, start, stop)
+
+    def iter_sections(
+        self,
+        pdf_path: str,
+        chunk_size: int = 1000,
+        overlap: int = 200,
+        pages: Optional[Iterable[Tuple[int, str]]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily chunks a PDF into sections, consuming pages as they are parsed.
+        `pages` defaults to iter_pages(pdf_path); each section dict is yielded as soon as
+        it is cut, so downstream work (e.g. embedding) can start before parsing finishes.
+        Chunks may span a page break; a section's page_number is the page it starts on.
 
-        sections = []
-        current_page = 0
-        for page_num, page in enumerate(reader.pages):
-            current_page = page_num + 1  # Page numbers are 1-indexed
-            text = page.extract_text()
+        Yields dictionaries with 'content', 'page_number', 'section_title'.
+        """
+        if pages is None:
+            pages = self.iter_pages(pdf_path)
+
+        # Pages are appended to a rolling buffer so chunks run across page breaks; only the
+        # uncut tail (at most about chunk_size characters) is carried over to the next page.
+        buffer = ""
+        page_offsets: List[int] = []  # Buffer offset where each buffered page's text starts
+        page_numbers: List[int] = []
+        section_count = 0
+        for current_page, text in pages:
             if not text:
                 continue
-
-            # Simple chunking by character count
-            start_idx = 0
-            while start_idx < len(text):
-                end_idx = start_idx + chunk_size
-                chunk = text[start_idx:end_idx]
-
-                # Attempt to find a natural break (e.g., end of sentence)
-                # This is a very basic attempt; real-world parsing might need NLP
-                if end_idx < len(text):
-                    last_period = chunk.rfind(".")
-                    last_newline = chunk.rfind("\n")
-                    split_point = max(last_period, last_newline)
-
-                    if split_point > chunk_size * 0.75:  # If a good split point is near the end
-                        chunk = text[start_idx : start_idx + split_point + 1]
-                        start_idx += split_point + 1
-                    else:
-                        start_idx += chunk_size - overlap  # Move back by overlap
-                else:
-                    start_idx += chunk_size  # Process remaining chunk
-
-                if chunk.strip():  # Add only non-empty chunks
-                    sections.append(
-                        {
-                            "content": chunk.strip(),
-                            "page_number": current_page,
-                            "section_title": f"Page {current_page} Chunk {len(sections)+1}",  # Placeholder
-                        }
-                    )
+            if buffer:
+                buffer += "\n"
+            page_offsets.append(len(buffer))
+            page_numbers.append(current_page)
+            buffer += text
+
+            chunks, resume_idx = _cut_chunks(buffer, chunk_size, overlap, final=False)
+            for start_idx, chunk in chunks:
+                section_count += 1
+                yield self._make_section(chunk, page_numbers[bisect_right(page_offsets, start_idx) - 1], section_count)
+
+            # Drop the consumed text, keeping the page that the carried-over tail starts on
+            first_kept = bisect_right(page_offsets, resume_idx) - 1
+            buffer = buffer[resume_idx:]
+            page_offsets = [max(0, offset - resume_idx) for offset in page_offsets[first_kept:]]
+            page_numbers = page_numbers[first_kept:]
+
+        chunks, _ = _cut_chunks(buffer, chunk_size, overlap, final=True)
+        for start_idx, chunk in chunks:
+            section_count += 1
+            yield self._make_section(chunk, page_numbers[bisect_right(page_offsets, start_idx) - 1], section_count)
 
         # TODO: Implement more sophisticated section extraction (e.g., based on headings, TOC)
         # This currently just chunks pages. A real paper parser would use layout analysis
         # to identify Introduction, Methodology, etc. This is a complex task.
 
+    @staticmethod
+    def _make_section(content: str, page_number: int, section_number: int) -> Dict[str, Any]:
+        """
+        Builds a section dict; page_number is the page the section starts on.
+        """
+        return {
+            "content": content,
+            "page_number": page_number,
+            "section_title": f"Page {page_number} Chunk {section_number}",  # Placeholder
+        }
+
+    def extract_sections_from_pdf(self, pdf_path: str, chunk_size: int = 1000, overlap: int = 200) -> List[Dict[str, Any]]:
+        """
+        Extracts text from a PDF and chunks it into manageable sections.
+        This is a simple chunking mechanism. More advanced methods (e.g., based on headings,
+        semantic similarity) might be needed for better RAG performance.
+
+        Returns a list of dictionaries, each with 'content', 'page_number', 'section_title' (optional).
+        """
+        sections = []
+        try:
+            for section in self.iter_sections(pdf_path, chunk_size=chunk_size, overlap=overlap):
+                sections.append(section)
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF '{pdf_path}': {e}")
         return sections
 
 
@@ -1,2 +1,3 @@
 from .retriever import Retriever
 from .generator import Generator
+from .answer_cache import AnswerCache
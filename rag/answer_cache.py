@@ -0,0 +1,83 @@
+# paper_agent/rag/answer_cache.py
+
+import threading
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from utils.config import config
+from utils.logger import logger
+
+
+class AnswerCache:
+    """
+    Semantic cache of RAG answers. A query whose embedding has a cosine similarity of at least
+    ANSWER_CACHE_SIMILARITY with an earlier query's reuses that query's answer, skipping both
+    retrieval and the LLM call. Entries live in memory and are dropped as soon as the
+    library's embeddings change, so an answer never outlives the papers it was built from.
+    Off unless ANSWER_CACHE_SIZE is set: sentence embeddings can score questions with opposite
+    meanings or different subjects ("advantages of X" / "disadvantages of X") above 0.95.
+    """
+
+    def __init__(self, similarity_threshold: Optional[float] = None, max_entries: Optional[int] = None):
+        self.similarity_threshold = float(
+            similarity_threshold if similarity_threshold is not None else config.get("ANSWER_CACHE_SIMILARITY", 0.95)
+        )
+        self.max_entries = int(max_entries if max_entries is not None else config.get("ANSWER_CACHE_SIZE", 0))
+        self._version = None
+        # Row i of _embeddings is the unit-length query embedding of _entries[i], oldest first
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+        self._entries: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        logger.info(f"AnswerCache initialized (threshold={self.similarity_threshold}, size={self.max_entries}).")
+
+    @staticmethod
+    def _normalize(query_embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(query_embedding, dtype=np.float32).ravel()
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def _sync_version(self, version: Any) -> None:
+        # Must be called with the lock held
+        if version is None or version != self._version:
+            if self._entries:
+                logger.debug(f"Embeddings changed; dropping {len(self._entries)} cached answers.")
+            self._embeddings = np.empty((0, 0), dtype=np.float32)
+            self._entries = []
+            self._version = version
+
+    def get(self, query_embedding: np.ndarray, top_k: int, version: Any) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached result of the most similar earlier query made with the same top_k,
+        or None if none is similar enough or the embeddings changed (version differs) since.
+        """
+        if self.max_entries <= 0:
+            return None
+        vector = self._normalize(query_embedding)
+        with self._lock:
+            self._sync_version(version)
+            if not self._entries or self._embeddings.shape[1] != vector.shape[0]:
+                return None
+            similarities = self._embeddings @ vector
+            for i in np.argsort(-similarities):
+                if similarities[i] < self.similarity_threshold:
+                    break
+                if self._entries[i]["top_k"] == top_k:
+                    logger.info(f"Answer cache hit (similarity {similarities[i]:.3f}).")
+                    return self._entries[i]["result"]
+        return None
+
+    def put(self, query_embedding: np.ndarray, top_k: int, version: Any, result: Dict[str, Any]) -> None:
+        """
+        Stores the result of a query, evicting the oldest entry when the cache is full.
+        """
+        if self.max_entries <= 0 or version is None:
+            return
+        vector = self._normalize(query_embedding)
+        with self._lock:
+            self._sync_version(version)
+            if not self._entries or self._embeddings.shape[1] != vector.shape[0]:
+                # First entry, or the embedding model changed dimension
+                self._embeddings = np.empty((0, vector.shape[0]), dtype=np.float32)
+                self._entries = []
+            self._embeddings = np.vstack([self._embeddings, vector])[-self.max_entries :]
+            self._entries = (self._entries + [{"top_k": top_k, "result": result}])[-self.max_entries :]
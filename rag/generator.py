@@ -1,10 +1,38 @@
 # paper_agent/rag/generator.py
 
+import hashlib
+import logging
 from typing import List, Dict, Any, Optional
 
 from llm.llm_interface import LLMInterface
 from utils.logger import logger
 
+# Answers returned in place of an LLM answer.
+NO_CONTEXT_ANSWER = "I couldn't find any relevant information in your papers to answer that question."
+GENERATION_ERROR_ANSWER = "I apologize, but I encountered an error while trying to generate an answer."
+
+# Answer prompt template. The instructions before {context} are identical for every query,
+# so providers can serve them from their prompt cache; their hash keys that cache.
+_ANSWER_TEMPLATE = (
+    "You are an AI assistant that answers questions based on the provided academic paper excerpts.\n"
+    "Your goal is to provide a concise and accurate answer to the user's question,\n"
+    'strictly using only the information available in the "Context" sections below.\n'
+    "If the answer cannot be found in the provided context, state that you don't have enough information.\n"
+    "Do NOT make up any information.\n"
+    "\n"
+    "Context:\n"
+    "{context}"
+    "Question: {query}\n"
+    "\n"
+    "Answer:\n"
+)
+_ANSWER_CACHE_KEY = "answer-" + hashlib.sha256(_ANSWER_TEMPLATE.partition("{")[0].encode()).hexdigest()[:16]
+
+# One retrieved section in the answer prompt's context.
+_DOCUMENT_TEMPLATE = (
+    "--- Document {number} ---\nPaper Title: {paper_title}\nSection Title: {section_title}\nContent:\n{content}\n\n"
+)
+
 
 class Generator:
     """
@@ -30,39 +58,29 @@ class Generator:
             Optional[str]: The LLM-generated answer, or None if generation fails.
         """
         if not retrieved_sections:
-            return "I couldn't find any relevant information in your papers to answer that question."
-
-        context_parts = []
-        for i, section in enumerate(retrieved_sections):
-            context_parts.append(f"--- Document {i+1} ---")
-            context_parts.append(f"Paper Title: {section.get('paper_title', 'N/A')}")
-            context_parts.append(f"Section Title: {section.get('section_title', 'N/A')}")
-            context_parts.append(f"Content:\n{section['content']}")
-            context_parts.append("\n")
-
-        context = "\n".join(context_parts)
-
-        prompt = f"""
-        You are an AI assistant that answers questions based on the provided academic paper excerpts.
-        Your goal is to provide a concise and accurate answer to the user's question,
-        strictly using only the information available in the "Context" sections below.
-        If the answer cannot be found in the provided context, state that you don't have enough information.
-        Do NOT make up any information.
-
-        Context:
-        {context}
-
-        Question: {query}
-
-        Answer:
-        """
-
-        logger.debug(f"Sending prompt to LLM (first 500 chars): {prompt[:500]}...")
-        answer = self.llm.generate_text(prompt, max_tokens=500, temperature=0.2)  # Lower temperature for factual answers
+            return NO_CONTEXT_ANSWER
+
+        context = "".join(
+            _DOCUMENT_TEMPLATE.format_map(
+                {
+                    "number": i,
+                    "paper_title": section.get("paper_title", "N/A"),
+                    "section_title": section.get("section_title", "N/A"),
+                    "content": section["content"],
+                }
+            )
+            for i, section in enumerate(retrieved_sections, 1)
+        )
+        prompt = _ANSWER_TEMPLATE.format_map({"context": context, "query": query})
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending prompt to LLM (first 500 chars): {prompt[:500]}...")
+        # Lower temperature for factual answers
+        answer = self.llm.generate_text(prompt, max_tokens=500, temperature=0.2, cache_key=_ANSWER_CACHE_KEY)
 
         if answer:
             logger.info(f"LLM generated answer for query: '{query[:50]}...'")
             return answer
         else:
             logger.error(f"LLM failed to generate an answer for query: '{query}'")
-            return "I apologize, but I encountered an error while trying to generate an answer."
+            return GENERATION_ERROR_ANSWER
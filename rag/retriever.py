@@ -1,13 +1,18 @@
 # paper_agent/rag/retriever.py
 
-from typing import List, Dict, Any, Optional
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from database.db_manager import DBManager
 from embeddings.embedding_model import EmbeddingModel
 from utils.logger import logger
 
+# Most recent query embeddings kept in memory, so a repeated query skips the embedding model.
+_QUERY_EMBEDDING_CACHE_SIZE = 1024
+
 
 class Retriever:
     """
@@ -17,95 +22,115 @@ class Retriever:
     def __init__(self, db_manager: DBManager, embedding_model: EmbeddingModel):
         self.db_manager = db_manager
         self.embedding_model = embedding_model
+        # ((embeddings version, dimension), section_ids, matrix): all section embeddings of the query
+        # dimension, L2-normalized and kept in memory between queries; reloaded only when the
+        # database reports they changed
+        self._index: Tuple[Any, np.ndarray, np.ndarray] = (None, np.empty(0, dtype=np.int64), np.empty((0, 0)))
+        # LRU of whitespace-normalized query -> its embedding (read-only)
+        self._query_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
         logger.info("Retriever initialized.")
 
-    def _get_all_section_embeddings(self) -> List[Dict[str, Any]]:
+    def _get_all_section_embeddings(self, dim: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Retrieves all section IDs, content, and their embeddings from the database.
-        Returns a list of dictionaries, each containing 'id', 'content', and 'embedding'.
+        Retrieves the `dim`-dimensional embeddings of all sections as one matrix of unit-length
+        rows, from memory unless they changed in the database since the last call.
+        Returns (section_ids, matrix), where row i of matrix belongs to section_ids[i].
         """
-        all_sections_data = []
-        # Get all paper IDs first
-        all_papers = self.db_manager.get_all_papers()
-        if not all_papers:
-            logger.warning("No papers found in the database for retrieval.")
-            return []
-
-        for paper in all_papers:
-            paper_id = paper["id"]
-            sections = self.db_manager.get_sections_for_paper(paper_id)
-            for section in sections:
-                if section["embedding"] is not None:
-                    all_sections_data.append(
-                        {
-                            "id": section["id"],
-                            "paper_id": paper_id,  # Include paper_id for context
-                            "content": section["content"],
-                            "page_number": section["page_number"],
-                            "section_title": section["section_title"],
-                            "embedding": section["embedding"],
-                        }
-                    )
-        logger.debug(f"Loaded {len(all_sections_data)} section embeddings from database.")
-        return all_sections_data
-
-    def retrieve_relevant_sections(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        version = self.db_manager.embeddings_version()
+        cached_version, section_ids, matrix = self._index
+        if version is None or (version, dim) != cached_version:
+            section_ids, matrix = self.db_manager.get_embedding_matrix(dim=dim)
+            # Normalized once per load, so scoring a query is a single dot product
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+            self._index = ((version, dim), section_ids, matrix)
+            logger.debug(f"Loaded {section_ids.size} section embeddings from database.")
+        if section_ids.size == 0:
+            logger.warning("No section embeddings found in the database for retrieval.")
+        return section_ids, matrix
+
+    def embed_query(self, query: str) -> Optional[np.ndarray]:
+        """
+        Returns the embedding of a query, reusing it if the same query (ignoring surrounding
+        and repeated whitespace) was embedded recently. Returns None if embedding fails.
+        """
+        key = " ".join(query.split())
+        with self._query_embeddings_lock:
+            cached = self._query_embeddings.get(key)
+            if cached is not None:
+                self._query_embeddings.move_to_end(key)
+                return cached
+
+        query_embedding = self.embedding_model.get_embedding(key)
+        if query_embedding is None:
+            return None
+        query_embedding.flags.writeable = False  # Shared by every caller that repeats the query
+        with self._query_embeddings_lock:
+            self._query_embeddings[key] = query_embedding
+            if len(self._query_embeddings) > _QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        return query_embedding
+
+    def retrieve_relevant_sections(
+        self, query: str, top_k: int = 5, query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
         """
         Generates an embedding for the query and finds the top_k most similar sections.
 
         Args:
             query (str): The user's query string.
             top_k (int): The number of top relevant sections to retrieve.
+            query_embedding (Optional[np.ndarray]): The query's embedding, if already computed.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each representing a relevant section
                                    including its content, paper_id, and similarity score.
         """
-        query_embedding = self.embedding_model.get_embedding(query)
+        if query_embedding is None:
+            query_embedding = self.embed_query(query)
         if query_embedding is None:
             logger.error("Failed to generate embedding for the query.")
             return []
 
-        all_sections = self._get_all_section_embeddings()
-        if not all_sections:
+        query_vector = query_embedding.astype(np.float32).ravel()
+        section_ids, section_embeddings = self._get_all_section_embeddings(query_vector.shape[0])
+        if section_ids.size == 0 or top_k <= 0:
             return []
 
-        # Extract embeddings and section data
-        section_embeddings = np.array([s["embedding"] for s in all_sections])
-        section_data = [
-            {
-                "id": s["id"],
-                "paper_id": s["paper_id"],
-                "content": s["content"],
-                "page_number": s["page_number"],
-                "section_title": s["section_title"],
-            }
-            for s in all_sections
-        ]
-
-        # Calculate cosine similarity between query and all section embeddings
-        # Reshape query_embedding to (1, -1) for cosine_similarity
-        similarities = cosine_similarity(query_embedding.reshape(1, -1), section_embeddings)[0]
-
-        # Combine similarities with section data and sort
-        scored_sections = []
-        for i, similarity in enumerate(similarities):
-            scored_sections.append({"score": similarity, **section_data[i]})
-
-        # Sort by score in descending order and return top_k
-        scored_sections.sort(key=lambda x: x["score"], reverse=True)
-
-        # Add paper title to each retrieved section for better context
+        # Cosine similarity as one matrix-vector product over the pre-normalized (N, D) matrix
+        query_norm = np.linalg.norm(query_vector)
+        similarities = section_embeddings @ (query_vector / (query_norm or 1.0))
+
+        # Select the top_k without sorting every score, then order just those
+        k = min(top_k, similarities.shape[0])
+        top_idx = np.argpartition(-similarities, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-similarities[top_idx])]
+        scores = dict(zip(section_ids[top_idx].tolist(), similarities[top_idx].tolist()))
+
+        # Add paper title to each retrieved section for better context (one query for all of them)
+        sections = self.db_manager.get_sections_by_ids(list(scores))
+        titles = self.db_manager.get_paper_titles(list({sec.paper_id for sec in sections}))
         final_results = []
-        for sec in scored_sections[:top_k]:
-            paper_info = self.db_manager.get_paper(sec["paper_id"])
-            sec["paper_title"] = paper_info.get("title", "Unknown Paper") if paper_info else "Unknown Paper"
-            final_results.append(sec)
+        for sec in sections:
+            final_results.append(
+                {
+                    "score": scores[sec.id],
+                    "id": sec.id,
+                    "paper_id": sec.paper_id,
+                    "content": sec.content,
+                    "page_number": sec.page_number,
+                    "section_title": sec.section_title,
+                    "paper_title": titles.get(sec.paper_id, "Unknown Paper"),
+                }
+            )
 
         logger.info(f"Retrieved {len(final_results)} relevant sections for query: '{query[:50]}...'")
-        for res in final_results:
-            logger.debug(
-                f"  - Score: {res['score']:.4f}, Paper: {res['paper_title']}, Section: {res['section_title']} (ID: {res['id']})"
-            )
+        if logger.isEnabledFor(logging.DEBUG):  # Skip formatting a line per result unless it is logged
+            for res in final_results:
+                logger.debug(
+                    f"  - Score: {res['score']:.4f}, Paper: {res['paper_title']}, Section: {res['section_title']} (ID: {res['id']})"
+                )
 
         return final_results
@@ -58,12 +58,12 @@ class CLI:
     def show_help(self, args: str):
         """Displays available commands and their usage."""
         print("\n--- Available Commands ---")
-        print("  add <path_to_pdf>                  : Add a new paper from a PDF file.")
+        print("  add <pdf_or_dir> [--workers N]     : Add a paper from a PDF file, or every PDF in a directory.")
         print("  list                               : List all papers in your library.")
         print("  details <paper_id>                 : Show detailed information for a specific paper.")
         print("  query <your_question>              : Ask a question about your papers (RAG).")
         print("  summarize <paper_id>               : Generate a comprehensive summary for a paper using LLM.")
-        print("  tag <paper_id> <tag_name>          : Add a tag to a paper.")
+        print("  tag <paper_id> <tag_name>[, ...]   : Add one or more comma-separated tags to a paper.")
         print("  untag <paper_id> <tag_name>        : Remove a tag from a paper.")
         print("  delete <paper_id>                  : Delete a paper and all its data.")
         print("  help                               : Show this help message.")
@@ -73,13 +73,26 @@ class CLI:
     def add_paper_command(self, args: str):
         """Handles the 'add' command."""
         file_path = args.strip()
+        workers = None
+        parts = file_path.rsplit(maxsplit=2)
+        if len(parts) == 3 and parts[1] == "--workers":
+            try:
+                workers = int(parts[2])
+            except ValueError:
+                print("Usage: add <path_to_pdf_file_or_dir> [--workers N]")
+                return
+            file_path = parts[0]
         if not file_path:
-            print("Usage: add <path_to_pdf_file>")
+            print("Usage: add <path_to_pdf_file_or_dir> [--workers N]")
             return
 
         # Resolve absolute path for consistency
         absolute_path = os.path.abspath(file_path)
 
+        if os.path.isdir(absolute_path):
+            self._add_papers_from_dir(absolute_path, workers)
+            return
+
         # Check if the file exists before attempting to add
         if not os.path.exists(absolute_path):
             print(f"Error: File not found at '{absolute_path}'.")
@@ -95,6 +108,24 @@ class CLI:
         else:
             print("Failed to add paper. Check logs for details.")
 
+    def _add_papers_from_dir(self, dir_path: str, workers: Optional[int] = None):
+        """Adds every PDF in a directory, extracting them in parallel."""
+        pdf_paths = sorted(
+            os.path.join(dir_path, name) for name in os.listdir(dir_path) if name.lower().endswith(".pdf")
+        )
+        if not pdf_paths:
+            print(f"No PDF files found in '{dir_path}'.")
+            return
+
+        print(f"Attempting to add {len(pdf_paths)} PDFs from '{dir_path}'...")
+        results = self.paper_manager.add_papers_from_files(pdf_paths, workers=workers)
+        for pdf_path in pdf_paths:
+            paper_id = results.get(pdf_path)
+            if paper_id:
+                print(f"  Added '{os.path.basename(pdf_path)}' with ID: {paper_id}")
+            else:
+                print(f"  Failed to add '{os.path.basename(pdf_path)}'. Check logs for details.")
+
     def list_papers_command(self, args: str):
         """Handles the 'list' command."""
         papers = self.paper_manager.list_all_papers()
@@ -102,16 +133,19 @@ class CLI:
             print("Your library is empty. Use 'add <path_to_pdf>' to add papers.")
             return
 
-        print("\n--- Your Paper Library ---")
-        for paper in papers:
-            print(f"  ID: {paper['id']}")
-            print(f"  Title: {paper['title']}")
-            print(f"  Authors: {paper['authors']}")
-            print(f"  Year: {paper['publication_year']}")
-            print(f"  Path: {paper['file_path']}")
-            print(f"  Summarized: {'Yes' if paper['is_summarized'] else 'No'}")
-            print("-" * 30)
-        print(f"Total papers: {len(papers)}")
+        # Built up front and printed at once: one write for the whole library, not one per line
+        separator = "-" * 30
+        entries = "".join(
+            f"  ID: {paper['id']}\n"
+            f"  Title: {paper['title']}\n"
+            f"  Authors: {paper['authors']}\n"
+            f"  Year: {paper['publication_year']}\n"
+            f"  Path: {paper['file_path']}\n"
+            f"  Summarized: {'Yes' if paper['is_summarized'] else 'No'}\n"
+            f"{separator}\n"
+            for paper in papers
+        )
+        print(f"\n--- Your Paper Library ---\n{entries}Total papers: {len(papers)}")
 
     def show_paper_details_command(self, args: str):
         """Handles the 'details' command."""
@@ -123,25 +157,28 @@ class CLI:
 
         paper = self.paper_manager.get_paper_details(paper_id)
         if paper:
-            print(f"\n--- Details for Paper ID: {paper['id']} ---")
-            print(f"  Title: {paper['title']}")
-            print(f"  Authors: {paper['authors']}")
-            print(f"  Year: {paper['publication_year']}")
-            print(f"  Abstract:\n{paper['abstract']}")
-            print(f"  File Path: {paper['file_path']}")
-            print(f"  Added Date: {paper['added_date']}")
-            print(f"  DOI: {paper['doi'] if paper['doi'] else 'N/A'}")
-            print(f"  URL: {paper['url'] if paper['url'] else 'N/A'}")
-            print(f"  Summarized: {'Yes' if paper['is_summarized'] else 'No'}")
+            lines = [
+                f"\n--- Details for Paper ID: {paper['id']} ---",
+                f"  Title: {paper['title']}",
+                f"  Authors: {paper['authors']}",
+                f"  Year: {paper['publication_year']}",
+                f"  Abstract:\n{paper['abstract']}",
+                f"  File Path: {paper['file_path']}",
+                f"  Added Date: {paper['added_date']}",
+                f"  DOI: {paper['doi'] if paper['doi'] else 'N/A'}",
+                f"  URL: {paper['url'] if paper['url'] else 'N/A'}",
+                f"  Summarized: {'Yes' if paper['is_summarized'] else 'No'}",
+            ]
             if paper["is_summarized"]:
-                print(f"  Summary:\n{paper['summary_text']}")
-            print(f"  Tags: {', '.join([t['name'] for t in paper['tags']]) if paper['tags'] else 'None'}")
-            print(f"  References ({len(paper['references'])}):")
+                lines.append(f"  Summary:\n{paper['summary_text']}")
+            lines.append(f"  Tags: {', '.join([t['name'] for t in paper['tags']]) if paper['tags'] else 'None'}")
+            lines.append(f"  References ({len(paper['references'])}):")
             for ref in paper["references"]:
-                print(
+                lines.append(
                     f"    - {ref['cited_title']} ({ref['cited_year']}) by {ref['cited_authors']} (In Library: {'Yes' if ref['is_in_library'] else 'No'})"
                 )
-            print("---------------------------------------")
+            lines.append("---------------------------------------")
+            print("\n".join(lines))
         else:
             print(f"Paper with ID {paper_id} not found.")
 
@@ -202,20 +239,21 @@ class CLI:
         """Handles the 'tag' command."""
         parts = args.split(maxsplit=1)
         if len(parts) != 2:
-            print("Usage: tag <paper_id> <tag_name>")
+            print("Usage: tag <paper_id> <tag_name>[, <tag_name> ...]")
             return
 
         try:
             paper_id = int(parts[0])
             tag_name = parts[1].strip()
         except ValueError:
-            print("Usage: tag <paper_id> <tag_name>")
+            print("Usage: tag <paper_id> <tag_name>[, <tag_name> ...]")
             return
 
-        if self.paper_manager.add_tag_to_paper(paper_id, tag_name):
-            print(f"Tag '{tag_name}' added to paper ID {paper_id}.")
+        tag_names = [name.strip() for name in tag_name.split(",") if name.strip()]
+        if tag_names and self.paper_manager.add_tags_to_paper(paper_id, tag_names):
+            print(f"Tag(s) '{', '.join(tag_names)}' added to paper ID {paper_id}.")
         else:
-            print(f"Failed to add tag '{tag_name}' to paper ID {paper_id}.")
+            print(f"Failed to add tag(s) '{tag_name}' to paper ID {paper_id}.")
 
     def untag_paper_command(self, args: str):
         """Handles the 'untag' command."""
@@ -260,4 +298,5 @@ class CLI:
     def exit_cli(self, args: str):
         """Exits the CLI."""
         print("Exiting Paper Agent. Goodbye!")
+        self.paper_manager.db_manager.close_connection()
         exit()
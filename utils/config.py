@@ -1,7 +1,42 @@
 # paper_agent/utils/config.py
 
+import atexit
 import os
 import json
+import stat
+import threading
+
+# Project root (the parent of utils/); config and default data paths live under it.
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Changes are written to the config file this long after the last set()/update(), so a burst
+# of changes is saved with one write.
+_SAVE_DELAY_SECONDS = 0.25
+
+
+def _write_json_atomically(path, data):
+    """
+    Writes data as JSON to a temporary file and renames it over path, so a crash mid-write
+    never leaves a truncated config file behind. The file keeps its permissions; a new one
+    is only readable by its owner, since the config holds API keys.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())  # The data must be on disk before the rename makes it the config
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
 
 
 class Config:
@@ -11,14 +46,22 @@ class Config:
     """
 
     _instance = None
+    _instance_lock = threading.Lock()
     _config_data = {}
-    _config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
-    # _config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.json")
+    _config_path = os.path.join(_BASE_DIR, ".env")
+    # _config_path = os.path.join(_BASE_DIR, "config.json")
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-            cls._instance._load_config()
+            with cls._instance_lock:
+                if cls._instance is None:  # Another thread may have created it while we waited
+                    instance = super(Config, cls).__new__(cls)
+                    instance._save_lock = threading.Lock()
+                    instance._save_timer = None
+                    instance._dirty = False
+                    instance._load_config()
+                    atexit.register(instance.flush)  # Saves changes still waiting for their timer
+                    cls._instance = instance  # Published only once fully set up
         return cls._instance
 
     def _load_config(self):
@@ -26,36 +69,41 @@ class Config:
         Loads configuration from the config.json file.
         If the file doesn't exist, it creates a default one.
         """
-        if not os.path.exists(self._config_path):
-            self._create_default_config()
-
         try:
             with open(self._config_path, "r") as f:
                 self._config_data = json.load(f)
+        except FileNotFoundError:
+            self._create_default_config()  # Also loads the defaults
         except json.JSONDecodeError:
             print(f"Warning: config.json is malformed. Creating a default config at {self._config_path}")
             self._create_default_config()
-            self._load_config()  # Try loading again
 
     def _create_default_config(self):
         """
         Creates a default config.json file with placeholders.
+        The defaults are only kept in memory when PAPER_AGENT_EPHEMERAL is set (e.g. in tests
+        or CI) or when the file cannot be written.
         """
         default_config = {
-            "DATA_DIR": os.path.join(os.path.dirname(os.path.dirname(__file__)), "data"),
-            "PAPERS_DIR": os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "papers"),
-            "DB_DIR": os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "db"),
+            "DATA_DIR": os.path.join(_BASE_DIR, "data"),
+            "PAPERS_DIR": os.path.join(_BASE_DIR, "data", "papers"),
+            "DB_DIR": os.path.join(_BASE_DIR, "data", "db"),
             "DATABASE_NAME": "paper_agent.db",
             "EMBEDDING_MODEL_NAME": "sentence-transformers/all-MiniLM-L6-v2",  # A good default for local embeddings
             "LLM_API_KEY": "YOUR_OPENAI_API_KEY_OR_OTHER_LLM_KEY",  # Placeholder for LLM API key
             "LLM_MODEL_NAME": "gpt-4o-mini",  # Or "gpt-3.5-turbo", "llama3", etc.
             "LOG_LEVEL": "INFO",  # DEBUG, INFO, WARNING, ERROR, CRITICAL
-            "LOG_FILE": os.path.join(os.path.dirname(os.path.dirname(__file__)), "paper_agent.log"),
+            "LOG_FILE": os.path.join(_BASE_DIR, "paper_agent.log"),
         }
-        with open(self._config_path, "w") as f:
-            json.dump(default_config, f, indent=4)
-        print(f"Default config.json created at {self._config_path}. Please review and update it.")
         self._config_data = default_config  # Update current data
+        if os.environ.get("PAPER_AGENT_EPHEMERAL"):
+            return
+        try:
+            _write_json_atomically(self._config_path, default_config)
+        except OSError as e:
+            print(f"Warning: could not write a default config to {self._config_path} ({e}). Using defaults.")
+            return
+        print(f"Default config.json created at {self._config_path}. Please review and update it.")
 
     def get(self, key, default=None):
         """
@@ -65,18 +113,48 @@ class Config:
 
     def set(self, key, value):
         """
-        Sets a configuration value and saves it to the file.
+        Sets a configuration value. It is saved to the file shortly after, together with any
+        other changes made meanwhile, or by flush().
+        """
+        with self._save_lock:
+            self._config_data[key] = value
+            self._schedule_save()
+
+    def update(self, values):
+        """
+        Sets several configuration values, saved to the file with one write like set().
+        """
+        with self._save_lock:
+            self._config_data.update(values)
+            self._schedule_save()
+
+    def flush(self):
+        """
+        Saves pending changes to the file now, if there are any.
         """
-        self._config_data[key] = value
-        self._save_config()
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._dirty = False
+                self._save_config()
+
+    def _schedule_save(self):
+        # Must be called with the save lock held; each change restarts the delay
+        self._dirty = True
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(_SAVE_DELAY_SECONDS, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
 
     def _save_config(self):
         """
         Saves the current configuration data back to the config.json file.
         """
         try:
-            with open(self._config_path, "w") as f:
-                json.dump(self._config_data, f, indent=4)
+            _write_json_atomically(self._config_path, self._config_data)
         except IOError as e:
             print(f"Error saving config file: {e}")
 
@@ -1,10 +1,123 @@
 # paper_agent/utils/logger.py
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
 from .config import config  # Import our config instance
 
 
+# Size of the log file's write buffer; a batch of records is written to disk in chunks of this size.
+_LOG_STREAM_BUFFER_SIZE = 64 * 1024
+
+
+class _DeferredFlushFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotated log file that leaves its (64 KiB block-buffered) stream unflushed after each
+    record; _BufferedFileHandler flushes it, and checks whether to rotate, once per batch instead.
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_STREAM_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def shouldRollover(self, record):
+        # The stock check formats every record a second time and seeks the stream, which
+        # flushes it; the size is checked per batch by flush_stream() instead
+        return False
+
+    def flush(self):
+        pass
+
+    def flush_stream(self):
+        """
+        Writes out the stream's buffer, then rotates the file if it has reached maxBytes
+        (so a file may exceed it by up to one batch).
+        """
+        super().flush()
+        if self.maxBytes > 0 and self.stream and self.stream.tell() >= self.maxBytes:
+            self.doRollover()
+
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """
+    Keeps log records in memory and writes them to the log file in batches: once `capacity`
+    records are waiting, as soon as an ERROR (or worse) arrives, every `flush_interval` seconds,
+    and when logging shuts down at exit. The file is rotated once it reaches `max_bytes`,
+    keeping `backup_count` old files (0 disables rotation).
+    """
+
+    def __init__(self, log_file: str, capacity: int, flush_interval: float, max_bytes: int, backup_count: int):
+        # Created first, so logging.shutdown() closes it after this handler has flushed into it
+        target = _DeferredFlushFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self._closed = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._flush_periodically, args=(flush_interval,), name="log-flush", daemon=True
+            ).start()
+
+    def _flush_periodically(self, flush_interval: float):
+        while not self._closed.wait(flush_interval):
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            super().flush()  # Formats and writes the buffered records into the file's buffer
+            if self.target:
+                self.target.flush_stream()  # One write for the whole batch
+        finally:
+            self.release()
+
+    def close(self):
+        self._closed.set()
+        target = self.target
+        try:
+            super().close()  # Flushes what is left
+        finally:
+            if target:
+                target.close()
+
+
+# Accepted LOG_LEVEL names (DEBUG, INFO, WARNING, ...) and their numeric levels.
+_LOG_LEVELS = logging.getLevelNamesMapping()
+
+# Layout of every log line.
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class _Formatter(logging.Formatter):
+    """
+    Formatter for _LOG_FORMAT that formats the date and time of each second once, rather than
+    for every record logged in it, and builds each line with an f-string instead of
+    %-interpolating the record's attributes. Lines look exactly as with logging.Formatter.
+    """
+
+    def __init__(self):
+        super().__init__(_LOG_FORMAT)
+        self._formatted_second = (None, "")  # (second, its formatted date and time), replaced as a whole
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._formatted_second
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(second))
+            self._formatted_second = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
+
+    def formatMessage(self, record):
+        return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+
+
 class AppLogger:
     """
     Centralized logging utility for the Paper Agent application.
@@ -12,12 +125,17 @@ class AppLogger:
     """
 
     _instance = None
+    _instance_lock = threading.Lock()
     _logger = None
+    _listener = None
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(AppLogger, cls).__new__(cls)
-            cls._instance._setup_logger()
+            with cls._instance_lock:
+                if cls._instance is None:  # Another thread may have created it while we waited
+                    instance = super(AppLogger, cls).__new__(cls)
+                    instance._setup_logger()
+                    cls._instance = instance  # Published only once fully set up
         return cls._instance
 
     def _setup_logger(self):
@@ -28,34 +146,77 @@ class AppLogger:
             return  # Already set up
 
         self._logger = logging.getLogger("PaperAgent")
-        log_level_str = config.get("LOG_LEVEL", "INFO").upper()
+        if self._logger.handlers:
+            return  # Configured by an earlier AppLogger in this process; don't write every record twice
+        log_level_str = str(config.get("LOG_LEVEL", "INFO")).upper()
         log_file = config.get("LOG_FILE")
 
         # Set the logging level
-        numeric_level = getattr(logging, log_level_str, None)
-        if not isinstance(numeric_level, int):
-            raise ValueError(f"Invalid log level: {log_level_str}")
+        numeric_level = _LOG_LEVELS.get(log_level_str)
+        if numeric_level is None:
+            raise ValueError(f"Invalid log level: {log_level_str} (expected one of {', '.join(_LOG_LEVELS)})")
         self._logger.setLevel(numeric_level)
 
+        # The formatter below uses none of these record fields, so skip collecting them for every
+        # record (see "Optimization" in the logging HOWTO): the thread, process and multiprocessing
+        # process names. These switches are process-wide, so records of other libraries' loggers
+        # also carry None for threadName, process and processName; set LOG_RECORD_PROCESS_INFO to
+        # keep them for a handler that shows them
+        if not config.get("LOG_RECORD_PROCESS_INFO", False):
+            logging.logThreads = False
+            logging.logProcesses = False
+            logging.logMultiprocessing = False
+
         # Create formatter
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        formatter = _Formatter()  # Shared by the console and file handlers
 
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        self._logger.addHandler(console_handler)
+        handlers = [console_handler]
 
         # File handler
         if log_file:
             log_dir = os.path.dirname(log_file)
-            os.makedirs(log_dir, exist_ok=True)  # Ensure log directory exists
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(formatter)
-            self._logger.addHandler(file_handler)
+            if log_dir and not os.path.isdir(log_dir):  # No directory part means the working directory
+                os.makedirs(log_dir, exist_ok=True)  # Ensure log directory exists
+            file_handler = _BufferedFileHandler(
+                log_file,
+                capacity=int(config.get("LOG_BUFFER_CAPACITY", 512)),
+                flush_interval=float(config.get("LOG_FLUSH_INTERVAL", 30)),
+                max_bytes=int(config.get("LOG_MAX_BYTES", 10 * 1024 * 1024)),
+                backup_count=int(config.get("LOG_BACKUP_COUNT", 5)),
+            )
+            file_handler.target.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        # Logging calls only enqueue the record; a listener thread writes it to the handlers,
+        # so callers never wait for the console or the disk
+        queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        self._listener = logging.handlers.QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self._listener.stop)  # Runs before logging's own shutdown, so queued records are written
+        self._logger.addHandler(queue_handler)
+        # A forked worker process has no listener thread, so it writes through the handlers itself
+        os.register_at_fork(after_in_child=self._log_directly)
 
         # Prevent duplicate logs if handlers are added multiple times
         self._logger.propagate = False
 
+    def _log_directly(self):
+        """
+        Replaces the queue handler with the handlers it feeds. The log file is then written
+        record by record, since worker processes exit without running atexit handlers.
+        """
+        for handler in list(self._logger.handlers):
+            self._logger.removeHandler(handler)
+        for handler in self._listener.handlers:
+            if isinstance(handler, _BufferedFileHandler):
+                handler.buffer = []  # The parent's pending records; the parent writes them
+                handler.capacity = 1
+                handler.target.maxBytes = 0  # Only the parent rotates the file
+            self._logger.addHandler(handler)
+
     def get_logger(self):
         """
         Returns the configured logger instance.